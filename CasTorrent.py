@@ -14,15 +14,37 @@ import webbrowser
 import logging
 import sys
 import requests
-from collections import deque
+from collections import deque, namedtuple
 import psutil
 import csv
 import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
+from array import array
+from math import fsum, isfinite
+from urllib.parse import quote
+
+_lt_benc = getattr(lt, 'bencode', None)
+_lt_bdec = getattr(lt, 'bdecode', None)
+try:
+	from fastbencode import bencode as _benc, bdecode as _bdec  # optional C accelerator
+except ImportError:
+	_benc, _bdec = _lt_benc, _lt_bdec
+
+try:
+	import orjson  # optional C JSON encoder
+except ImportError:
+	orjson = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("TorrentClient")
 
+@lru_cache(maxsize=None)
 def platform_downloads_dir() -> Path:
+	# Fixed for the life of the process; resolve (and mkdir) it only once
 	home = Path.home()
 	downloads = home / "Downloads"
 	try:
@@ -31,11 +53,22 @@ def platform_downloads_dir() -> Path:
 		return home
 	return downloads
 
+_LT_CAPS = {}
+
+def lt_caps(obj):
+	# Binding capabilities are per wrapper type, so snapshot dir() once per type
+	t = type(obj)
+	caps = _LT_CAPS.get(t)
+	if caps is None:
+		try:
+			caps = frozenset(n for n in dir(obj) if not n.startswith('_'))
+		except Exception:
+			caps = frozenset()
+		_LT_CAPS[t] = caps
+	return caps
+
 def lt_has(obj, name):
-	try:
-		return hasattr(obj, name)
-	except Exception:
-		return False
+	return name in lt_caps(obj)
 
 def session_set_download_rate_limit(session, value):
 	try:
@@ -91,21 +124,55 @@ def safe_add_dht_routers(session):
 	except Exception:
 		pass
 
-def save_session_state_safe(session, path="session_state"):
-	try:
-		state = session.save_state()
-		data = None
+def dumps_json_pretty(obj) -> bytes:
+	if orjson is not None:
 		try:
-			data = lt.bencode(state)
+			return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
 		except Exception:
-			if isinstance(state, (bytes, bytearray)):
-				data = bytes(state)
-		if data is not None:
-			with open(path, "wb") as f:
-				f.write(data)
-			logger.info("Session state saved")
+			pass
+	# One encode to a string, written in one go, instead of json.dump's many small writes
+	return json.dumps(obj, indent=2).encode('utf-8')
+
+def write_file_atomic(path, data: bytes):
+	tmp = f"{path}.tmp"
+	with open(tmp, "wb") as f:
+		f.write(data)
+	os.replace(tmp, path)
+
+def save_session_state_safe(session, path="session_state", executor=None):
+	# Snapshot on the caller's thread; encoding and disk I/O can run on executor
+	try:
+		state = session.save_state()
 	except Exception as e:
 		logger.warning(f"Error saving session state: {e}")
+		return None
+
+	def _write():
+		try:
+			data = None
+			# fastbencode first, libtorrent's own encoder if it rejects the state
+			for enc in (_benc, _lt_benc):
+				if enc is None:
+					continue
+				try:
+					data = enc(state)
+					break
+				except Exception:
+					data = None
+			if data is None and isinstance(state, (bytes, bytearray)):
+				data = bytes(state)
+			if data is not None:
+				write_file_atomic(path, data)
+				logger.info("Session state saved")
+			else:
+				logger.warning("Session state not saved: no encoder accepted it")
+		except Exception as e:
+			logger.warning(f"Error saving session state: {e}")
+
+	if executor is not None:
+		return executor.submit(_write)
+	_write()
+	return None
 
 def load_session_state_safe(session, path="session_state"):
 	try:
@@ -114,11 +181,12 @@ def load_session_state_safe(session, path="session_state"):
 			return
 		raw = p.read_bytes()
 		state = None
-		try:
-			state = lt.bdecode(raw)
-		except Exception:
+		for dec in (_bdec, _lt_bdec):
+			if dec is None:
+				continue
 			try:
-				state = json.loads(raw.decode("utf-8"))
+				state = dec(raw)
+				break
 			except Exception:
 				state = None
 		if state is not None:
@@ -145,13 +213,145 @@ def safe_info_hash_str(handle):
 	except Exception:
 		return ""
 
+def magnet_xt(handle):
+	# Hex v1 hash as urn:btih, or a v2-only torrent's SHA-256 as a urn:btmh multihash
+	try:
+		ihs = handle.info_hashes()  # lt 2.x
+		has_v1 = ihs.has_v1() if hasattr(ihs, "has_v1") else bool(ihs.v1)
+		if has_v1:
+			return f"urn:btih:{str(ihs.v1)}"
+		has_v2 = ihs.has_v2() if hasattr(ihs, "has_v2") else bool(ihs.v2)
+		if has_v2:
+			return f"urn:btmh:1220{str(ihs.v2)}"
+		return None
+	except Exception:
+		pass
+	try:
+		return f"urn:btih:{str(handle.info_hash())}"  # lt 1.x
+	except Exception:
+		return None
+
+def status_info_hash_str(obj):
+	# torrent_status and torrent alerts carry the info hash as a plain attribute,
+	# which avoids a synchronous round-trip through the torrent handle
+	try:
+		ihs = getattr(obj, "info_hashes", None)  # lt 2.x
+		if ihs is not None:
+			if hasattr(ihs, "v1") and ihs.v1:
+				return ihs.v1.to_string()
+			if hasattr(ihs, "v2") and ihs.v2:
+				return ihs.v2.to_string()
+		ih = getattr(obj, "info_hash", None)  # lt 1.x
+		if ih is not None and not callable(ih):
+			return ih.to_string()
+	except Exception:
+		pass
+	return safe_info_hash_str(obj.handle)
+
+def alert_str_field(alert, name):
+	# lt 1.2+ exposes alert strings such as storage_path() as methods, older builds as attributes
+	v = getattr(alert, name, None)
+	if callable(v):
+		v = v()
+	return v or ""
+
+def params_info_hash_str(params):
+	# Hash an add_torrent_params already knows (.torrent file or parsed magnet);
+	# "" for url-only magnets whose hash is unknown until metadata arrives
+	if params is None:
+		return ""
+	try:
+		ti = getattr(params, "ti", None)
+		if ti is not None:
+			return safe_info_hash_str(ti)
+		ihs = getattr(params, "info_hashes", None)  # lt 2.x
+		if ihs is not None:
+			if hasattr(ihs, "v1") and ihs.v1:
+				return ihs.v1.to_string()
+			if hasattr(ihs, "v2") and ihs.v2:
+				return ihs.v2.to_string()
+		ih = getattr(params, "info_hash", None)  # lt 1.x
+		if ih is not None and not callable(ih):
+			if not (hasattr(ih, "is_all_zeros") and ih.is_all_zeros()):
+				return ih.to_string()
+	except Exception:
+		pass
+	return ""
+
+# torrent_status fields the GUI reads; copied once per reported status so repeated reads
+# across the list, status bar, live panel and General tab are plain tuple attribute access
+_STATUS_FIELDS = (
+	('handle', None), ('name', ''), ('state', None), ('paused', False), ('is_seeding', False),
+	('has_metadata', False), ('progress', 0.0), ('total_wanted', 0), ('total_done', 0),
+	('total_upload', 0), ('all_time_upload', 0), ('all_time_download', 0),
+	('download_rate', 0), ('upload_rate', 0), ('num_seeds', 0), ('num_complete', 0),
+	('num_peers', 0), ('num_incomplete', 0), ('num_pieces', 0), ('active_time', 0),
+	('seeding_time', 0), ('save_path', ''), ('errc', None), ('error', None),
+)
+
+StatusSnap = namedtuple('StatusSnap', [f for f, _ in _STATUS_FIELDS])
+
+def snap_status(st):
+	return StatusSnap._make([getattr(st, f, d) for f, d in _STATUS_FIELDS])
+
+def session_alert_mask():
+	cats = getattr(lt.alert, 'category_t', None)
+	mask = 0
+	for name in ('error_notification', 'status_notification', 'storage_notification'):
+		mask |= int(getattr(cats, name, 0))
+	return mask
+
+def session_set_alert_mask(session, mask):
+	try:
+		if hasattr(lt, 'settings_pack') and hasattr(lt.settings_pack, 'alert_mask'):
+			sp = lt.settings_pack()
+			sp.set_int(lt.settings_pack.alert_mask, int(mask))
+			session.apply_settings(sp)
+		elif lt_has(session, 'set_alert_mask'):
+			session.set_alert_mask(int(mask))
+	except Exception:
+		pass
+
+def set_paused_flags(params):
+	# paused and not auto-managed to prevent libtorrent from auto starting
+	try:
+		flags_base = getattr(lt, 'torrent_flags', None)
+		paused_flag = getattr(flags_base, 'paused', 0) if flags_base else 0
+		auto_managed_flag = getattr(flags_base, 'auto_managed', 0) if flags_base else 0
+		current_flags = getattr(params, 'flags', 0)
+		params.flags = (current_flags | paused_flag) & (~auto_managed_flag if auto_managed_flag else -1)
+	except Exception:
+		pass
+
+def file_path_parts(path):
+	# Torrent-relative paths only; cheaper than building a Path per file
+	return tuple(p for p in path.replace('\\', '/').split('/') if p)
+
+def insert_file_rows(tree, entries, dir_values, leaf_values):
+	# entries: (file_index, path parts tuple); directories are shared via their parts prefix
+	nodes = {}
+	rows = {}
+	insert = tree.insert
+	for file_index, parts in entries:
+		parent_id = ''
+		last = len(parts) - 1
+		for d in range(last):
+			key = parts[:d + 1]
+			node = nodes.get(key)
+			if node is None:
+				node = insert(parent_id, tk.END, text=parts[d], open=True, values=dir_values)
+				nodes[key] = node
+			parent_id = node
+		rows[file_index] = insert(parent_id, tk.END, text=parts[last], values=leaf_values(file_index), tags=(str(file_index), 'file'))
+	return rows
+
 def open_path_in_os(path: Path):
 	if sys.platform == 'win32':
 		os.startfile(str(path))
 	elif sys.platform == 'darwin':
-		os.system(f'open "{path}"')
+		subprocess.Popen(['open', str(path)])
 	else:
-		os.system(f'xdg-open "{path}"')
+		subprocess.Popen(['xdg-open', str(path)])
 
 FILE_PRIORITY_SKIP = 0
 FILE_PRIORITY_LOW = 1
@@ -163,24 +363,267 @@ FILE_PRIORITY_SIX = 6
 FILE_PRIORITY_MAX = 7
 FILE_PRIORITY_NORMAL = FILE_PRIORITY_FOUR
 
+FILES_WINDOW_SIZE = 200
+
+# Performance history is bounded: one sample per GUI tick, oldest samples overwritten
+PERF_HISTORY_SAMPLES = 1200
+
+SEARCH_DEBOUNCE_MS = 150
+
+TORRENT_COLUMNS = ('Name', 'Size', 'Progress', 'Status', 'Seeds', 'Peers', 'Down Speed', 'Up Speed', 'ETA', 'Ratio', 'Added On')
+# Heading -> position in the _sort_keys tuples
+SORT_COLUMN_INDEX = {col: i for i, col in enumerate(TORRENT_COLUMNS)}
+
+# (peer_info flag, letter) pairs, resolved once against the installed binding
+PEER_FLAG_TABLE = tuple(
+	(getattr(lt.peer_info, attr), letter)
+	for attr, letter in (
+		("interesting", "I"), ("choked", "C"), ("remote_interested", "i"), ("remote_choked", "c"),
+		("supports_extensions", "E"), ("handshake", "H"), ("connecting", "X"), ("queued", "Q"),
+		("on_parole", "P"), ("seed", "S"), ("optimistic_unchoke", "O"), ("snubbed", "U"),
+		("upload_only", "D"), ("endgame_mode", "F"), ("holepunched", "L"), ("i2p_peer", "Z"),
+		("utp_peer", "T"), ("webrtc_peer", "W"), ("outgoing", "O"),
+	)
+	if hasattr(getattr(lt, 'peer_info', None), attr)
+)
+
+# torrent_status.state -> label, resolved once against the installed binding;
+# error is left out because its text depends on the status
+_STATE_MAP = {
+	getattr(lt.torrent_status, attr): label
+	for attr, label in (
+		("queued_for_checking", "Queued"), ("checking_files", "Checking"),
+		("downloading_metadata", "Metadata"), ("downloading", "Downloading"),
+		("finished", "Finished"), ("seeding", "Seeding"), ("allocating", "Allocating"),
+		("checking_resume_data", "Checking Resume"),
+	)
+	if hasattr(getattr(lt, 'torrent_status', None), attr)
+}
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+_UNIT_DIVISORS = tuple(float(1 << (10 * i)) for i in range(len(_UNITS)))
+
+# One C-level fetch of the three fields ETA needs
+_eta_attrs = attrgetter('total_wanted', 'total_done', 'download_rate')
+
+def _format_bytes_value(v):
+	if v == 0:
+		return "0 B"
+	a = -v if v < 0 else v
+	if not isfinite(a):
+		# int() would raise on inf; keep the old loop's output ("inf PB" / "nan B")
+		i = len(_UNITS) - 1 if a >= 1 else 0
+	else:
+		# bit_length picks the 1024-power directly instead of dividing in a loop
+		i = min((int(a).bit_length() - 1) // 10, len(_UNITS) - 1) if a >= 1 else 0
+	sign = "-" if v < 0 else ""
+	return f"{sign}{a / _UNIT_DIVISORS[i]:.1f} {_UNITS[i]}"
+
+@lru_cache(maxsize=4096)
+def _format_bytes_int(v):
+	return _format_bytes_value(v)
+
+@lru_cache(maxsize=4096)
+def _format_speed_int(v):
+	return f"{_format_bytes_value(v)}/s"
+
+def format_bytes_any(value):
+	# Shared by the main window and the dialogs: ints hit the cache, floats skip it
+	t = type(value)
+	if t is int:
+		return _format_bytes_int(value)
+	if t is float:
+		return _format_bytes_value(value)
+	try:
+		return _format_bytes_value(float(value))
+	except Exception:
+		return _format_bytes_value(0.0)
+
+@lru_cache(maxsize=4096)
+def _format_time_int(s):
+	if s <= 0:
+		return "0s"
+	if s < 60:
+		return f"{s}s"
+	d, rem = divmod(s, 86400)
+	h, rem = divmod(rem, 3600)
+	m, s = divmod(rem, 60)
+	# s >= 60 here, so at least one of d/h/m is set and out is never empty
+	out = f"{d}d " if d else ""
+	if h: out += f"{h}h "
+	if m: out += f"{m}m "
+	if s: out += f"{s}s "
+	return out[:-1]
+
+class StatsRing:
+	# Fixed-size ring of C doubles; replaces deque(maxlen=N) of boxed floats
+	__slots__ = ('buf', 'size', 'idx', 'count', 'seq', 'peaks', 'total', 'run', 'version')
+
+	def __init__(self, size):
+		self.buf = array('d', bytes(8 * size))
+		self.size = size
+		self.idx = 0
+		self.count = 0
+		self.seq = 0
+		# Monotonic (seq, value) queue: the front is always the window maximum
+		self.peaks = deque()
+		# Running sum of the retained samples, for an O(1) mean
+		self.total = 0.0
+		# Length of the trailing run of equal samples, and a counter that only
+		# moves when the retained window actually changes
+		self.run = 0
+		self.version = 0
+
+	def append(self, value):
+		evicted = self.buf[self.idx] if self.count == self.size else 0.0
+		if self.count and self.buf[self.idx - 1] == value:
+			self.run += 1
+		else:
+			self.run = 1
+		self.buf[self.idx] = value
+		self.idx = (self.idx + 1) % self.size
+		if self.count < self.size:
+			self.count += 1
+		if self.idx == 0:
+			# Re-sum exactly once per lap so float drift cannot accumulate
+			self.total = fsum(self.buf)
+		else:
+			self.total += value - evicted
+		peaks = self.peaks
+		while peaks and peaks[-1][1] <= value:
+			peaks.pop()
+		peaks.append((self.seq, value))
+		self.seq += 1
+		if peaks[0][0] <= self.seq - 1 - self.size:
+			peaks.popleft()
+		# A full window of identical samples shifted by one more of the same is unchanged
+		if self.run <= self.size:
+			self.version += 1
+
+	def mean(self):
+		return self.total / self.count if self.count else 0.0
+
+	def peak(self):
+		# Maximum of the retained samples in O(1), no scan over the ring
+		return self.peaks[0][1] if self.peaks else 0.0
+
+	def __len__(self):
+		return self.count
+
+	def __getitem__(self, i):
+		if i < 0:
+			i += self.count
+		if not 0 <= i < self.count:
+			raise IndexError("StatsRing index out of range")
+		return self.buf[(self.idx - self.count + i) % self.size]
+
+	def snapshot(self):
+		# Oldest to newest, as a single contiguous array
+		if self.count < self.size:
+			return self.buf[:self.count]
+		return self.buf[self.idx:] + self.buf[:self.idx]
+
+	def __iter__(self):
+		return iter(self.snapshot())
+
+class TorrentEntry:
+	__slots__ = ('handle', 'added_time', 'source', 'save_path', 'moved', 'name_hint')
+
+	def __init__(self, handle, save_path, source='unknown', name_hint=''):
+		self.handle = handle
+		self.added_time = datetime.now()
+		self.source = source
+		self.save_path = save_path
+		self.moved = False
+		self.name_hint = name_hint
+
 class TorrentClient:
 	def __init__(self):
 		self.config = self.load_config()
 		self.session = lt.session()
+		self._session_caps = lt_caps(self.session)
+		try:
+			self._handle_caps = lt_caps(lt.torrent_handle())
+		except Exception:
+			self._handle_caps = frozenset()
 		self.apply_initial_session_settings()
 
 		self.torrents = {}
 		self.download_history = deque(maxlen=5000)
 
 		self.performance_stats = {
-			'download_speeds': deque(maxlen=1200),
-			'upload_speeds': deque(maxlen=1200),
-			'memory_usage': deque(maxlen=1200),
-			'cpu_usage': deque(maxlen=1200),
+			'download_speeds': StatsRing(PERF_HISTORY_SAMPLES),
+			'upload_speeds': StatsRing(PERF_HISTORY_SAMPLES),
+			'memory_usage': StatsRing(PERF_HISTORY_SAMPLES),
+			'cpu_usage': StatsRing(PERF_HISTORY_SAMPLES),
 		}
+		# Column order of one performance sample row: (dl, ul, rss, cpu)
+		self._perf_rings = tuple(self.performance_stats[k] for k in ('download_speeds', 'upload_speeds', 'memory_usage', 'cpu_usage'))
+		# session.status() taken once per GUI tick and shared by every panel
+		self._tick_sst = None
 
 		self._last_live_status_render = 0
 		self._live_status_line_to_hash = {}
+		# Last body written to each read-only Text widget
+		self._last_general_text = None
+		self._last_perf_text = None
+		self._last_live_text = None
+		self._last_live_sig = None
+		# Bumped whenever alert statuses or removals are applied
+		self._status_gen = 0
+
+		self._tree_items = {}
+		self._tree_last_values = {}
+		self._sort_keys = {}
+		# Latest torrent_status per hash, fed from state_update_alert
+		self._status_cache = {}
+		self._last_totals = {}
+		self._completion_state = {}
+		self._all_files = []
+		self._files_key = None
+		self._files_handle = None
+		self._files_window_start = 0
+		self._files_slide_pending = False
+		self._file_progress_cache = {}
+		self._files_cache = {}
+		self._ti_cache = {}
+		self._files_rows = {}
+		# Search/hide-completed filter state
+		self._row_search_text = {}
+		self._hidden_rows = set()
+		self._search_needle = ""
+		self._search_after = None
+
+		# Filled by the update thread from state_update_alert / torrent_removed_alert
+		self._alert_lock = threading.Lock()
+		self._pending_statuses = {}
+		self._pending_removed = []
+		self._pending_added = []
+		self._pending_moved = []
+		# Contexts of async_add_torrent calls, matched to add_torrent_alert by info hash;
+		# url-only magnets have no hash up front and are matched in order instead
+		self._pending_adds = {}
+		self._pending_unkeyed_adds = deque()
+		self._preselect_queue = deque()
+		self._preselect_running = False
+
+		# GUI refresh throttling
+		self._last_gui_update = 0.0
+		self._gui_min_interval = 1.0 / 30
+		self._gui_tick = 0
+
+		self._io_pool = ThreadPoolExecutor(max_workers=1)
+
+		# Process metrics are sampled off the GUI thread every few seconds
+		self._perf_proc = psutil.Process(os.getpid())
+		try:
+			# First cpu_percent(None) call only sets the baseline; prime it so the first sample is real
+			self._perf_proc.cpu_percent(None)
+			self._perf_cache = (0.0, self._perf_proc.memory_info().rss)
+		except Exception:
+			self._perf_cache = (0.0, 0)
+		self._last_move_check = 0.0
+		self._moves_in_flight = set()
 
 		self.root = tk.Tk()
 		self._bg_image_obj = None
@@ -192,14 +635,11 @@ class TorrentClient:
 		self.running = True
 		self.update_thread = threading.Thread(target=self.update_torrents_loop, daemon=True)
 		self.update_thread.start()
+		self._perf_thread = threading.Thread(target=self.sample_process_loop, daemon=True)
+		self._perf_thread.start()
 
 	def apply_initial_session_settings(self):
-		session_set_max_connections(self.session, self.config.get('max_connections', 4000))
-		session_set_max_uploads(self.session, self.config.get('max_uploads', 1000))
-		session_set_download_rate_limit(self.session, self.config.get('global_dl_limit', 0))
-		session_set_upload_rate_limit(self.session, self.config.get('global_ul_limit', 0))
-
-		self.apply_speed_tuning()
+		self.apply_session_limits()
 
 		port_range = self.config.get('port_range', [6881, 6891])
 		if not session_listen_on(self.session, port_range[0], port_range[1]):
@@ -214,6 +654,16 @@ class TorrentClient:
 
 		load_session_state_safe(self.session)
 
+	def apply_session_limits(self):
+		if self.apply_speed_tuning():
+			return
+		# libtorrent < 1.1 has no settings_pack, fall back to the individual setters
+		session_set_max_connections(self.session, self.config.get('max_connections', 4000))
+		session_set_max_uploads(self.session, self.config.get('max_uploads', 1000))
+		session_set_download_rate_limit(self.session, self.config.get('global_dl_limit', 0))
+		session_set_upload_rate_limit(self.session, self.config.get('global_ul_limit', 0))
+		session_set_alert_mask(self.session, session_alert_mask())
+
 	def apply_speed_tuning(self):
 		try:
 			sp = lt.settings_pack()
@@ -221,6 +671,16 @@ class TorrentClient:
 			set_bool = getattr(sp, 'set_bool')
 			set_str = getattr(sp, 'set_str')
 
+			# Global limits and alerts, batched into the same pack
+			if hasattr(lt.settings_pack, 'download_rate_limit'):
+				set_int(lt.settings_pack.download_rate_limit, int(self.config.get('global_dl_limit', 0)))
+			if hasattr(lt.settings_pack, 'upload_rate_limit'):
+				set_int(lt.settings_pack.upload_rate_limit, int(self.config.get('global_ul_limit', 0)))
+			if hasattr(lt.settings_pack, 'alert_mask'):
+				set_int(lt.settings_pack.alert_mask, session_alert_mask())
+			if hasattr(lt.settings_pack, 'listen_queue_size'):
+				set_int(lt.settings_pack.listen_queue_size, 32)
+
 			# Connection and requests (aggressive for high throughput)
 			if hasattr(lt.settings_pack, 'connections_limit'):
 				set_int(lt.settings_pack.connections_limit, int(self.config.get('max_connections', 4000)))
@@ -304,8 +764,10 @@ class TorrentClient:
 				set_int(lt.settings_pack.suggest_mode, getattr(lt.settings_pack, 'suggest_read_cache', getattr(lt.settings_pack, 'auto_suggest', 0)))
 
 			self.session.apply_settings(sp)
+			return True
 		except Exception as e:
 			logger.warning(f"Speed tuning apply failed: {e}")
+			return False
 
 	def setup_gui(self):
 		self.root.title("Advanced BitTorrent Client")
@@ -324,6 +786,12 @@ class TorrentClient:
 		self.create_details_panel()
 		self.create_status_bar()
 
+		self.tree.tag_configure('seeding', foreground='green')
+		self.tree.tag_configure('downloading', foreground='blue')
+		self.tree.tag_configure('checking', foreground='orange')
+		self.tree.tag_configure('error', foreground='red')
+		self.tree.tag_configure('paused', foreground='gray')
+
 		try:
 			style = ttk.Style()
 			style.theme_use('clam')
@@ -472,7 +940,7 @@ class TorrentClient:
 		menubar.add_cascade(label="View", menu=view_menu)
 		self.hide_completed_var = tk.BooleanVar(value=False)
 		self.live_status_var = tk.BooleanVar(value=True)
-		view_menu.add_checkbutton(label="Hide Completed/Seeding", variable=self.hide_completed_var, command=self.refresh_filter_view)
+		view_menu.add_checkbutton(label="Hide Completed/Seeding", variable=self.hide_completed_var, command=self.on_hide_completed_toggled)
 		view_menu.add_checkbutton(label="Show Live Status Panel", variable=self.live_status_var, command=self.toggle_live_status_panel)
 		theme_menu = tk.Menu(view_menu, tearoff=0)
 		view_menu.add_cascade(label="Theme", menu=theme_menu)
@@ -558,7 +1026,8 @@ class TorrentClient:
 		self.search_var = tk.StringVar()
 		search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=28)
 		search_entry.pack(side=tk.LEFT)
-		search_entry.bind('<KeyRelease>', self.filter_torrents)
+		# Fires only when the text actually changes, not on arrow/modifier keys
+		self.search_var.trace_add('write', lambda *a: self._maybe_filter())
 
 	def create_torrent_list(self):
 		self.paned = ttk.PanedWindow(self.root, orient=tk.VERTICAL)
@@ -570,7 +1039,7 @@ class TorrentClient:
 		tree_frame = ttk.Frame(list_frame)
 		tree_frame.pack(fill=tk.BOTH, expand=True)
 
-		columns = ('Name', 'Size', 'Progress', 'Status', 'Seeds', 'Peers', 'Down Speed', 'Up Speed', 'ETA', 'Ratio', 'Added On')
+		columns = TORRENT_COLUMNS
 		self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=24)
 
 		column_widths = [420, 130, 100, 130, 80, 80, 130, 130, 100, 80, 190]
@@ -596,6 +1065,7 @@ class TorrentClient:
 
 		self.notebook = ttk.Notebook(details_frame)
 		self.notebook.pack(fill=tk.BOTH, expand=True)
+		self.notebook.bind('<<NotebookTabChanged>>', lambda e: self.update_details())
 
 		self.general_frame = ttk.Frame(self.notebook)
 		self.notebook.add(self.general_frame, text="General")
@@ -641,7 +1111,8 @@ class TorrentClient:
 
 		files_v_scroll = ttk.Scrollbar(files_frame, orient=tk.VERTICAL, command=self.files_tree.yview)
 		files_h_scroll = ttk.Scrollbar(files_frame, orient=tk.HORIZONTAL, command=self.files_tree.xview)
-		self.files_tree.configure(yscrollcommand=files_v_scroll.set, xscrollcommand=files_h_scroll.set)
+		self._files_v_scroll = files_v_scroll
+		self.files_tree.configure(yscrollcommand=self.on_files_yscroll, xscrollcommand=files_h_scroll.set)
 
 		self.files_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 		files_v_scroll.pack(side=tk.RIGHT, fill=tk.Y)
@@ -709,6 +1180,8 @@ class TorrentClient:
 			if visible:
 				self.live_status_text.insert(tk.END, "Live status enabled.\n")
 			self.live_status_text.configure(state=tk.DISABLED)
+			self._last_live_text = None
+			self._last_live_sig = None
 		except Exception:
 			pass
 
@@ -830,12 +1303,20 @@ class TorrentClient:
 	def download_torrent_from_url(self, url, save_path, fast_download=None, preselect_files=True):
 		try:
 			self.log(f"Downloading torrent from URL: {url}")
-			r = requests.get(url, timeout=30)
-			r.raise_for_status()
-			tmp = Path(f"temp_{int(time.time())}.torrent")
-			tmp.write_bytes(r.content)
-			self.add_torrent(str(tmp), save_path, fast_download=fast_download, preselect_files=preselect_files)
-			threading.Timer(5.0, lambda: tmp.exists() and tmp.unlink()).start()
+			tmp = None
+			try:
+				with requests.get(url, timeout=30, stream=True) as r, \
+						tempfile.NamedTemporaryFile(suffix='.torrent', delete=False) as tf:
+					tmp = tf.name
+					r.raise_for_status()
+					for chunk in r.iter_content(chunk_size=64 * 1024):
+						tf.write(chunk)
+				self.add_torrent(tmp, save_path, fast_download=fast_download, preselect_files=preselect_files)
+			finally:
+				# torrent_info is parsed into memory by add_torrent, the file is no longer needed
+				if tmp:
+					try: os.unlink(tmp)
+					except Exception: pass
 		except Exception as e:
 			messagebox.showerror("Error", f"Failed to download/add torrent: {e}")
 			self.log(f"URL add error: {e}")
@@ -843,28 +1324,28 @@ class TorrentClient:
 	def apply_fast_download(self, handle, fast_download):
 		try:
 			# Ultra-aggressive per-torrent tuning, but DO NOT resume here
-			if lt_has(handle, 'set_max_connections'):
+			if 'set_max_connections' in self._handle_caps:
 				handle.set_max_connections(4000)
-			if lt_has(handle, 'set_max_uploads'):
+			if 'set_max_uploads' in self._handle_caps:
 				handle.set_max_uploads(2000)
-			if lt_has(handle, 'set_download_limit'):
+			if 'set_download_limit' in self._handle_caps:
 				handle.set_download_limit(0)  # unlimited
-			if lt_has(handle, 'set_upload_limit'):
+			if 'set_upload_limit' in self._handle_caps:
 				handle.set_upload_limit(0)  # unlimited
-			if lt_has(handle, 'set_sequential_download'):
+			if 'set_sequential_download' in self._handle_caps:
 				handle.set_sequential_download(bool(self.config.get('fast_download_sequential', True)))
 
 			# user fast settings overlay
 			if fast_download and fast_download.get('enabled', False):
 				connections = int(fast_download.get('connections', 20))
-				if lt_has(handle, 'set_max_connections'):
+				if 'set_max_connections' in self._handle_caps:
 					handle.set_max_connections(max(200, connections * 300))
-				if lt_has(handle, 'set_max_uploads'):
+				if 'set_max_uploads' in self._handle_caps:
 					handle.set_max_uploads(max(100, connections * 60))
-				if fast_download.get('sequential', True) and lt_has(handle, 'set_sequential_download'):
+				if fast_download.get('sequential', True) and 'set_sequential_download' in self._handle_caps:
 					handle.set_sequential_download(True)
 
-			if lt_has(handle, 'set_upload_mode'):
+			if 'set_upload_mode' in self._handle_caps:
 				handle.set_upload_mode(False)
 		except Exception:
 			pass
@@ -874,57 +1355,93 @@ class TorrentClient:
 			save_path = self.config.get('download_path', str(platform_downloads_dir()))
 		Path(save_path).mkdir(parents=True, exist_ok=True)
 
-		if str(torrent_source).startswith("magnet:"):
+		is_magnet = str(torrent_source).startswith("magnet:")
+		info = None
+		if is_magnet:
 			# Add paused to allow preselection after metadata arrives
-			params = lt.add_torrent_params()
+			params = None
+			if hasattr(lt, 'parse_magnet_uri'):
+				try:
+					params = lt.parse_magnet_uri(torrent_source)
+					if isinstance(params, dict):
+						params = None
+				except Exception:
+					params = None
+			if params is None:
+				params = lt.add_torrent_params()
+				params.url = torrent_source
 			params.save_path = save_path
-			params.url = torrent_source
-			try:
-				flags_base = getattr(lt, 'torrent_flags', None)
-				paused_flag = getattr(flags_base, 'paused', 0) if flags_base else 0
-				auto_managed_flag = getattr(flags_base, 'auto_managed', 0) if flags_base else 0
-				current_flags = getattr(params, 'flags', 0)
-				# paused and not auto-managed to prevent libtorrent from auto starting
-				params.flags = (current_flags | paused_flag) & (~auto_managed_flag if auto_managed_flag else -1)
-			except Exception:
-				pass
-			handle = self.session.add_torrent(params)
-			# hard pause safeguard
-			try: handle.pause()
-			except Exception: pass
+			set_paused_flags(params)
 			source_type = 'magnet'
 			name_hint = torrent_source[:64] + "..."
 		else:
 			info = lt.torrent_info(torrent_source)
 			# Start paused so we can preselect
 			try:
-				atp = lt.add_torrent_params()
-				atp.ti = info
-				atp.save_path = save_path
-				try:
-					flags_base = getattr(lt, 'torrent_flags', None)
-					paused_flag = getattr(flags_base, 'paused', 0) if flags_base else 0
-					auto_managed_flag = getattr(flags_base, 'auto_managed', 0) if flags_base else 0
-					current_flags = getattr(atp, 'flags', 0)
-					atp.flags = (current_flags | paused_flag) & (~auto_managed_flag if auto_managed_flag else -1)
-				except Exception:
-					pass
-				handle = self.session.add_torrent(atp)
+				params = lt.add_torrent_params()
+				params.ti = info
+				params.save_path = save_path
+				set_paused_flags(params)
 			except Exception:
-				params = {
-					'ti': info,
-					'save_path': save_path,
-					'storage_mode': lt.storage_mode_t.storage_mode_sparse if hasattr(lt, 'storage_mode_t') else 0
-				}
-				handle = self.session.add_torrent(params)
-				try: handle.pause()
-				except Exception: pass
-			# hard pause safeguard
-			try: handle.pause()
-			except Exception: pass
+				params = None
 			source_type = 'file'
 			name_hint = info.name()
 
+		ctx = (source_type, name_hint, save_path, fast_download, preselect_files, is_magnet)
+		if params is not None and 'async_add_torrent' in self._session_caps:
+			# The handle comes back in add_torrent_alert, see _on_torrent_added
+			key = params_info_hash_str(params)
+			if key:
+				self._pending_adds.setdefault(key, ctx)
+			else:
+				self._pending_unkeyed_adds.append(ctx)
+			self.session.async_add_torrent(params)
+			return
+
+		try:
+			if params is None:
+				raise ValueError
+			handle = self.session.add_torrent(params)
+		except Exception:
+			if is_magnet:
+				raise
+			params = {
+				'ti': info,
+				'save_path': save_path,
+				'storage_mode': lt.storage_mode_t.storage_mode_sparse if hasattr(lt, 'storage_mode_t') else 0
+			}
+			handle = self.session.add_torrent(params)
+		# hard pause safeguard
+		try: handle.pause()
+		except Exception: pass
+		self._finish_add_torrent(handle, ctx)
+		self._run_preselect_queue()
+
+	def _on_torrent_added(self, handle, error=None, key=""):
+		t_hash = key or safe_info_hash_str(handle)
+		ctx = self._pending_adds.pop(t_hash, None)
+		if ctx is None:
+			# Synchronous adds and restored torrents are registered elsewhere; only an
+			# alert without a known hash can belong to a pending url-only magnet
+			if key or t_hash in self.torrents or not self._pending_unkeyed_adds:
+				return
+			ctx = self._pending_unkeyed_adds.popleft()
+		try:
+			failed = bool(error and error.value()) or not handle.is_valid()
+		except Exception:
+			failed = False
+		if failed:
+			msg = error.message() if error is not None and hasattr(error, 'message') else 'invalid handle'
+			self.log(f"Failed to add torrent {ctx[1]}: {msg}")
+			return
+		try: handle.pause()
+		except Exception: pass
+		self._finish_add_torrent(handle, ctx)
+
+	def _finish_add_torrent(self, handle, ctx):
+		source_type, name_hint, save_path, fast_download, preselect_files, is_magnet = ctx
+		if not self._handle_caps:
+			self._handle_caps = lt_caps(handle)
 		# apply speed tweaks but remain paused
 		self.apply_fast_download(handle, fast_download)
 		try: handle.pause()
@@ -935,17 +1452,11 @@ class TorrentClient:
 			self.log(f"Skipped duplicate torrent: {name_hint}")
 			return
 
-		self.torrents[t_hash] = {
-			'handle': handle,
-			'added_time': datetime.now(),
-			'source': source_type,
-			'save_path': save_path,
-			'moved': False
-		}
+		self.torrents[t_hash] = TorrentEntry(handle, save_path, source_type, name_hint)
 
 		try:
 			st = handle.status()
-			name = getattr(st, 'name', None) or (handle.name() if lt_has(handle, 'name') else name_hint)
+			name = getattr(st, 'name', None) or (handle.name() if 'name' in self._handle_caps else name_hint)
 		except Exception:
 			name = name_hint
 
@@ -957,9 +1468,23 @@ class TorrentClient:
 			'save_path': save_path
 		})
 
+		self._preselect_queue.append((handle, t_hash, fast_download, preselect_files, is_magnet))
+
+	def _run_preselect_queue(self):
+		# Selection dialogs are modal; run them one at a time even when adds complete in bulk
+		if self._preselect_running:
+			return
+		self._preselect_running = True
+		try:
+			while self._preselect_queue:
+				self._preselect_added(*self._preselect_queue.popleft())
+		finally:
+			self._preselect_running = False
+
+	def _preselect_added(self, handle, t_hash, fast_download, preselect_files, is_magnet):
 		# Always do preselection to prevent auto-download of unwanted files
 		if preselect_files:
-			if str(torrent_source).startswith("magnet:"):
+			if is_magnet:
 				# Wait for metadata then open selectors, then per-torrent speed popup, then resume
 				threading.Thread(target=self._wait_and_preselect_for_magnet, args=(handle, t_hash, fast_download), daemon=True).start()
 			else:
@@ -1057,7 +1582,7 @@ class TorrentClient:
 			# prioritize first/last pieces for faster preview
 			try:
 				num_pieces = torrent_info.num_pieces()
-				if num_pieces > 0 and lt_has(handle, 'prioritize_pieces'):
+				if num_pieces > 0 and 'prioritize_pieces' in self._handle_caps:
 					pp = [1] * num_pieces
 					pp[0] = 7
 					pp[-1] = 7
@@ -1075,15 +1600,15 @@ class TorrentClient:
 			pt_res = per_t.result
 			if pt_res:
 				try:
-					if lt_has(handle, 'set_max_connections'):
+					if 'set_max_connections' in self._handle_caps:
 						handle.set_max_connections(int(pt_res.get('connections', 1000)))
-					if lt_has(handle, 'set_max_uploads'):
+					if 'set_max_uploads' in self._handle_caps:
 						handle.set_max_uploads(int(pt_res.get('uploads', 500)))
-					if lt_has(handle, 'set_download_limit'):
+					if 'set_download_limit' in self._handle_caps:
 						handle.set_download_limit(max(0, int(pt_res.get('dl_limit', 0))))
-					if lt_has(handle, 'set_upload_limit'):
+					if 'set_upload_limit' in self._handle_caps:
 						handle.set_upload_limit(max(0, int(pt_res.get('ul_limit', 0))))
-					if lt_has(handle, 'set_sequential_download'):
+					if 'set_sequential_download' in self._handle_caps:
 						handle.set_sequential_download(bool(pt_res.get('sequential', True)))
 				except Exception as e:
 					self.log(f"Per-torrent speed apply error: {e}")
@@ -1092,7 +1617,7 @@ class TorrentClient:
 
 		# Finally resume/download only what was selected
 		try:
-			if lt_has(handle, 'set_upload_mode'):
+			if 'set_upload_mode' in self._handle_caps:
 				handle.set_upload_mode(False)
 			handle.resume()
 			self.log("Started download with selected files only.")
@@ -1106,93 +1631,202 @@ class TorrentClient:
 					self.session.post_torrent_updates()
 				except Exception:
 					pass
-				self.root.after(0, self.update_gui_elements)
 				time.sleep(1)
+				if not self.running:
+					break
+				self.collect_session_alerts()
+				if self.root.state() == 'iconic':
+					# Nothing is visible; keep only the disk housekeeping going
+					self.root.after(0, self.background_housekeeping)
+				else:
+					self.root.after(0, self.update_gui_elements)
 			except Exception as e:
 				self.log(f"Update loop error: {e}")
 				time.sleep(3)
 
+	def collect_session_alerts(self):
+		# Runs on the update thread; only changed torrents are reported by libtorrent
+		try:
+			alerts = self.session.pop_alerts()
+		except Exception:
+			return
+		statuses = {}
+		removed = []
+		added = []
+		moved = []
+		for a in alerts:
+			try:
+				if isinstance(a, lt.state_update_alert):
+					for st in a.status:
+						statuses[status_info_hash_str(st)] = snap_status(st)
+				elif isinstance(a, lt.torrent_removed_alert):
+					removed.append(status_info_hash_str(a))
+				elif isinstance(a, lt.add_torrent_alert):
+					added.append((a.handle, getattr(a, 'error', None), params_info_hash_str(getattr(a, 'params', None))))
+				elif isinstance(a, lt.storage_moved_alert):
+					path = alert_str_field(a, 'storage_path') or alert_str_field(a, 'path')
+					moved.append((status_info_hash_str(a), path, None))
+				elif isinstance(a, lt.storage_moved_failed_alert):
+					moved.append((status_info_hash_str(a), alert_str_field(a, 'file_path'), a.message()))
+			except Exception:
+				continue
+		if not statuses and not removed and not added and not moved:
+			return
+		with self._alert_lock:
+			self._pending_statuses.update(statuses)
+			self._pending_removed.extend(removed)
+			self._pending_added.extend(added)
+			self._pending_moved.extend(moved)
+
+	def background_housekeeping(self):
+		# Minimised: the tree is not refreshed, but auto-move still needs current statuses.
+		# Peek rather than drain so update_torrent_list renders them on restore; the
+		# completion state is left to update_tree_item so Hide Completed still re-filters then.
+		with self._alert_lock:
+			statuses = dict(self._pending_statuses)
+		self._status_cache.update(statuses)
+		self.auto_move_completed()
+
+	def sample_process_loop(self):
+		while self.running:
+			try:
+				self._perf_cache = (self._perf_proc.cpu_percent(None), self._perf_proc.memory_info().rss)
+			except Exception:
+				pass
+			time.sleep(5)
+
 	def update_gui_elements(self):
+		now = time.monotonic()
+		if now - self._last_gui_update < self._gui_min_interval:
+			return
+		self._last_gui_update = now
+		self._gui_tick += 1
+		self._tick_sst = None
+		slow_tick = self._gui_tick % 3 == 0
 		try:
 			self.update_torrent_list()
-			self.update_details()
+			if slow_tick:
+				self.update_details()
 			self.update_status_bar()
 			self.update_performance_stats()
+			if slow_tick:
+				self.update_performance_tab()
 			self.auto_move_completed()
 			self.update_live_status()
-			if self.hide_completed_var.get():
-				self.refresh_filter_view()
 		except Exception as e:
 			self.log(f"GUI update error: {e}")
 
 	def update_torrent_list(self):
-		try:
-			handles = self.session.get_torrents()
-		except Exception:
-			handles = []
-		current = set()
-		for h in handles:
-			try:
-				if not h.is_valid():
-					continue
-			except Exception:
-				continue
-			t_hash = safe_info_hash_str(h)
-			current.add(t_hash)
+		with self._alert_lock:
+			statuses = self._pending_statuses
+			removed = self._pending_removed
+			added = self._pending_added
+			moved = self._pending_moved
+			self._pending_statuses = {}
+			self._pending_removed = []
+			self._pending_added = []
+			self._pending_moved = []
+		# Finish adds first so new torrents keep their source and preselection
+		for h, err, key in added:
+			self._on_torrent_added(h, err, key)
+		if self._preselect_queue and not self._preselect_running:
+			self.root.after(0, self._run_preselect_queue)
+		if statuses or removed:
+			self._status_gen += 1
+		self._status_cache.update(statuses)
+		for t_hash, st in statuses.items():
+			h = st.handle
 			if t_hash not in self.torrents:
-				self.torrents[t_hash] = {
-					'handle': h,
-					'added_time': datetime.now(),
-					'source': 'unknown',
-					'save_path': getattr(h.status(), 'save_path', self.config.get('download_path', str(platform_downloads_dir()))),
-					'moved': False
-				}
-			self.update_tree_item(t_hash, h, h.status())
-		for gone in set(self.torrents.keys()) - current:
+				if not self._handle_caps:
+					self._handle_caps = lt_caps(h)
+				self.torrents[t_hash] = TorrentEntry(h, getattr(st, 'save_path', self.config.get('download_path', str(platform_downloads_dir()))))
+			self.update_tree_item(t_hash, h, st)
+		for gone in removed:
 			self.remove_tree_item(gone)
 			self.torrents.pop(gone, None)
+		for t_hash, path, error in moved:
+			if t_hash in self._moves_in_flight:
+				self._finish_move(t_hash, path, error)
 
 	def update_tree_item(self, torrent_hash, handle, status):
-		existing_item = None
-		for item in self.tree.get_children():
-			tags = self.tree.item(item)['tags']
-			if tags and tags[0] == torrent_hash:
-				existing_item = item
-				break
+		existing_item = self._tree_items.get(torrent_hash)
 
+		# Status fields are plain numbers: call the memoised formatters directly,
+		# skipping the method frame and type dispatch of format_bytes/format_speed
+		format_bytes = _format_bytes_int
+		format_speed = _format_speed_int
+
+		s = status
 		try:
-			name = getattr(status, 'name', None) or (handle.name() if lt_has(handle, "name") else "Loading...")
-		except Exception:
-			name = "Loading..."
-
-		size = self.format_bytes(getattr(status, "total_wanted", 0))
-		progress = f"{getattr(status, 'progress', 0.0) * 100:.1f}%"
-		state = self.get_status_text(status)
-		seeds = f"{getattr(status, 'num_seeds', 0)} ({getattr(status, 'num_complete', 0)})"
-		peers = f"{getattr(status, 'num_peers', 0)} ({getattr(status, 'num_incomplete', 0)})"
-		down_speed = self.format_speed(getattr(status, "download_rate", 0))
-		up_speed = self.format_speed(getattr(status, "upload_rate", 0))
-		eta = self.calculate_eta(status)
-		all_up = float(getattr(status, "all_time_upload", getattr(status, "total_upload", 0)))
-		all_down = float(getattr(status, "all_time_download", getattr(status, "total_download", 1)))
-		ratio = f"{all_up / max(all_down, 1.0):.2f}"
-		added_time = self.torrents.get(torrent_hash, {}).get('added_time', datetime.now())
+			name = s.name or "Loading..."
+			total_wanted, total_done, dl_rate = _eta_attrs(s)
+			progress_f = s.progress
+			num_seeds = s.num_seeds
+			num_complete = s.num_complete
+			num_peers = s.num_peers
+			num_incomplete = s.num_incomplete
+			ul_rate = s.upload_rate
+			all_up = s.all_time_upload
+			all_down = s.all_time_download
+			state_code = s.state
+		except AttributeError:
+			return
+
+		size = format_bytes(total_wanted)
+		progress = f"{progress_f * 100:.1f}%"
+		state = self.get_status_text(s)
+		seeds = f"{num_seeds} ({num_complete})"
+		peers = f"{num_peers} ({num_incomplete})"
+		down_speed = format_speed(dl_rate)
+		up_speed = format_speed(ul_rate)
+		# Ratio/ETA only move when transfer totals or the rate do; idle rows reuse them
+		totals_key = (all_up >> 10, all_down >> 10, dl_rate, total_wanted >> 10)
+		cached = self._last_totals.get(torrent_hash)
+		totals_unchanged = bool(cached) and cached[0] == totals_key
+		if totals_unchanged:
+			ratio, eta, eta_s, ratio_f = cached[1], cached[2], cached[3], cached[4]
+		else:
+			# Numeric ETA/ratio computed once; the display text and the sort key both come from it
+			remaining = max(0, total_wanted - total_done)
+			eta_s = remaining / dl_rate if dl_rate > 0 and remaining > 0 else float('inf')
+			ratio_f = all_up / max(all_down, 1)
+			eta = self.format_time(int(eta_s)) if eta_s != float('inf') else "∞"
+			ratio = f"{ratio_f:.2f}"
+			self._last_totals[torrent_hash] = (totals_key, ratio, eta, eta_s, ratio_f)
+		entry = self.torrents.get(torrent_hash)
+		added_time = entry.added_time if entry else datetime.now()
 		added_str = added_time.strftime("%Y-%m-%d %H:%M")
 
 		values = (name, size, progress, state, seeds, peers, down_speed, up_speed, eta, ratio, added_str)
-		tag = self.get_state_tag(status)
+		tag = self.get_state_tag(s)
+		rendered = (values, tag)
 
+		prev = self._tree_last_values.get(torrent_hash)
 		if existing_item:
-			self.tree.item(existing_item, values=values)
-			self.tree.item(existing_item, tags=(torrent_hash, tag))
+			# Skip the Tcl round-trip when the row is unchanged since last tick
+			if prev != rendered:
+				self.tree.item(existing_item, values=values, tags=(torrent_hash, tag))
 		else:
-			self.tree.insert('', tk.END, values=values, tags=(torrent_hash, tag))
-
-		self.tree.tag_configure('seeding', foreground='green')
-		self.tree.tag_configure('downloading', foreground='blue')
-		self.tree.tag_configure('checking', foreground='orange')
-		self.tree.tag_configure('error', foreground='red')
-		self.tree.tag_configure('paused', foreground='gray')
+			existing_item = self.tree.insert('', tk.END, values=values, tags=(torrent_hash, tag))
+			self._tree_items[torrent_hash] = existing_item
+		self._tree_last_values[torrent_hash] = rendered
+		row_changed = prev != rendered
+		if row_changed:
+			# Raw values per column so sort_treeview never parses the display strings
+			self._sort_keys[torrent_hash] = (
+				name.lower(), total_wanted, progress_f, state.lower(), num_seeds, num_peers,
+				dl_rate, ul_rate, eta_s, ratio_f, added_str
+			)
+			# Lowercased text of every column plus the hash prefix, matched by the search filter
+			self._row_search_text[torrent_hash] = " ".join([str(v) for v in values]).lower() + " " + torrent_hash[:16].lower()
+
+		# Only rows whose completion or text changed need to be re-filtered
+		is_complete = progress_f >= 0.9999 or state_code == lt.torrent_status.seeding
+		flipped = self._completion_state.get(torrent_hash) != is_complete
+		if flipped:
+			self._completion_state[torrent_hash] = is_complete
+		if flipped or (row_changed and self._search_needle):
+			self._apply_row_visibility(torrent_hash, existing_item)
 
 	def get_state_tag(self, status):
 		try:
@@ -1212,11 +1846,23 @@ class TorrentClient:
 		return ''
 
 	def remove_tree_item(self, torrent_hash):
-		for item in self.tree.get_children():
-			tags = self.tree.item(item)['tags']
-			if tags and tags[0] == torrent_hash:
-				self.tree.delete(item)
-				break
+		# Drop the row and every per-torrent cache keyed by its hash
+		iid = self._tree_items.pop(torrent_hash, None)
+		self._tree_last_values.pop(torrent_hash, None)
+		self._sort_keys.pop(torrent_hash, None)
+		self._status_cache.pop(torrent_hash, None)
+		self._last_totals.pop(torrent_hash, None)
+		self._completion_state.pop(torrent_hash, None)
+		self._file_progress_cache.pop(torrent_hash, None)
+		self._files_cache.pop(torrent_hash, None)
+		self._ti_cache.pop(torrent_hash, None)
+		self._row_search_text.pop(torrent_hash, None)
+		self._hidden_rows.discard(torrent_hash)
+		if iid:
+			try:
+				self.tree.delete(iid)
+			except Exception:
+				pass
 
 	def update_details(self):
 		selection = self.tree.selection()
@@ -1232,33 +1878,42 @@ class TorrentClient:
 		if t_hash not in self.torrents:
 			self.set_general_placeholder()
 			return
-		handle = self.torrents[t_hash]['handle']
-		status = handle.status()
-		self.update_general_info(handle, status)
-		tab_idx = self.notebook.index(self.notebook.select())
-		if tab_idx == 1:
-			self.update_files_info(handle)
-		elif tab_idx == 2:
+		handle = self.torrents[t_hash].handle
+		# Only the visible tab is rendered; switching tabs triggers a refresh
+		tab = self.notebook.tab(self.notebook.select(), 'text')
+		if tab == "General":
+			status = self._status_cache.get(t_hash) or handle.status()
+			self.update_general_info(handle, status, t_hash)
+		elif tab == "Files":
+			self.update_files_info(handle, t_hash)
+		elif tab == "Peers":
 			self.update_peers_info(handle)
-		elif tab_idx == 3:
+		elif tab == "Trackers":
 			self.update_trackers_info(handle)
 
 	def set_general_placeholder(self):
-		self.general_text.config(state=tk.NORMAL)
-		self.general_text.delete(1.0, tk.END)
-		self.general_text.insert(tk.END, "Select a torrent to view details.")
-		self.general_text.config(state=tk.DISABLED)
+		self.set_readonly_text(self.general_text, '_last_general_text', "Select a torrent to view details.")
 		for w in (self.files_tree, self.peers_tree, self.trackers_tree):
-			for child in w.get_children():
-				w.delete(child)
+			w.delete(*w.get_children())
+		self._files_key = None
+		self._files_rows = {}
+
+	def torrent_info_for(self, t_hash, handle, status=None):
+		# torrent_info is immutable once metadata is in; keep one wrapper per hash
+		ti = self._ti_cache.get(t_hash)
+		if ti is None:
+			try:
+				if status is None:
+					status = self._status_cache.get(t_hash) or handle.status()
+				if getattr(status, "has_metadata", False):
+					ti = handle.get_torrent_info()
+					self._ti_cache[t_hash] = ti
+			except Exception:
+				ti = None
+		return ti
 
-	def update_general_info(self, handle, status):
-		torrent_info = None
-		try:
-			if getattr(status, "has_metadata", False):
-				torrent_info = handle.get_torrent_info()
-		except Exception:
-			torrent_info = None
+	def update_general_info(self, handle, status, t_hash=None):
+		torrent_info = self.torrent_info_for(t_hash or safe_info_hash_str(handle), handle, status)
 
 		creation_date_str = 'Unknown'
 		try:
@@ -1269,88 +1924,197 @@ class TorrentClient:
 		except Exception:
 			pass
 
-		def fmt_time(seconds):
-			return self.format_time(int(seconds or 0))
-
-		content_name = getattr(status, 'name', '') or (handle.name() if lt_has(handle, "name") else 'N/A')
-
-		info_text = f"""Name: {content_name}
-Size: {self.format_bytes(getattr(status, 'total_wanted', 0))}
-Progress: {getattr(status, 'progress', 0.0) * 100:.2f}%
-Status: {self.get_status_text(status)}
-Download Rate: {self.format_speed(getattr(status, 'download_rate', 0))}
-Upload Rate: {self.format_speed(getattr(status, 'upload_rate', 0))}
-Seeds: {getattr(status, 'num_seeds', 0)} connected, {getattr(status, 'num_complete', 0)}) total
-Peers: {getattr(status, 'num_peers', 0)} connected, {getattr(status, 'num_incomplete', 0)} total
-Downloaded: {self.format_bytes(getattr(status, 'total_done', 0))}
-Uploaded: {self.format_bytes(getattr(status, 'total_upload', 0))}
-Ratio: {float(getattr(status, 'total_upload', 0)) / max(float(getattr(status, 'total_done', 0)), 1.0):.3f}
-Time Active: {fmt_time(getattr(status, 'active_time', 0))}
-Seeding Time: {fmt_time(getattr(status, 'seeding_time', 0))}
-Save Path: {getattr(status, 'save_path', '')}
-Top-Level Path: {(Path(getattr(status, 'save_path', '')) / content_name) if content_name not in ('N/A','') else ''}
-Hash: {safe_info_hash_str(handle)}
-Created By: {(torrent_info.creator() if torrent_info and hasattr(torrent_info, 'creator') else 'Unknown')}
-Created On: {creation_date_str}
-Comment: {(torrent_info.comment() if torrent_info and hasattr(torrent_info, 'comment') else 'Unknown')}
-"""
-		self.general_text.config(state=tk.NORMAL)
-		self.general_text.delete(1.0, tk.END)
-		self.general_text.insert(tk.END, info_text)
-		self.general_text.config(state=tk.DISABLED)
+		fmt_time = self.format_time
+		content_name = getattr(status, 'name', '') or (handle.name() if "name" in self._handle_caps else 'N/A')
+		save_path = getattr(status, 'save_path', '')
+		total_done = getattr(status, 'total_done', 0)
+		total_upload = getattr(status, 'total_upload', 0)
+		creator = torrent_info.creator() if torrent_info and hasattr(torrent_info, 'creator') else 'Unknown'
+		comment = torrent_info.comment() if torrent_info and hasattr(torrent_info, 'comment') else 'Unknown'
+
+		lines = [
+			f"Name: {content_name}",
+			f"Size: {self.format_bytes(getattr(status, 'total_wanted', 0))}",
+			f"Progress: {getattr(status, 'progress', 0.0) * 100:.2f}%",
+			f"Status: {self.get_status_text(status)}",
+			f"Download Rate: {self.format_speed(getattr(status, 'download_rate', 0))}",
+			f"Upload Rate: {self.format_speed(getattr(status, 'upload_rate', 0))}",
+			f"Seeds: {getattr(status, 'num_seeds', 0)} connected, {getattr(status, 'num_complete', 0)} total",
+			f"Peers: {getattr(status, 'num_peers', 0)} connected, {getattr(status, 'num_incomplete', 0)} total",
+			f"Downloaded: {self.format_bytes(total_done)}",
+			f"Uploaded: {self.format_bytes(total_upload)}",
+			f"Ratio: {float(total_upload) / max(float(total_done), 1.0):.3f}",
+			f"Time Active: {fmt_time(getattr(status, 'active_time', 0) or 0)}",
+			f"Seeding Time: {fmt_time(getattr(status, 'seeding_time', 0) or 0)}",
+			f"Save Path: {save_path}",
+			f"Top-Level Path: {(Path(save_path) / content_name) if content_name not in ('N/A', '') else ''}",
+			f"Hash: {safe_info_hash_str(handle)}",
+			f"Created By: {creator}",
+			f"Created On: {creation_date_str}",
+			f"Comment: {comment}",
+			"",
+		]
+		info_text = "\n".join(lines)
+		self.set_readonly_text(self.general_text, '_last_general_text', info_text)
+
+	def set_readonly_text(self, widget, cache_attr, text):
+		# Skip the Tcl round-trips entirely when the body is unchanged
+		if getattr(self, cache_attr) == text:
+			return
+		widget.config(state=tk.NORMAL)
+		widget.replace('1.0', tk.END, text)
+		widget.config(state=tk.DISABLED)
+		setattr(self, cache_attr, text)
+
+	def update_files_info(self, handle, t_hash=None):
+		if t_hash is None:
+			t_hash = safe_info_hash_str(handle)
+		st = self._status_cache.get(t_hash) or handle.status()
+		# A torrent's file list never changes once metadata is in, so build it once per hash
+		all_files = self._files_cache.get(t_hash)
+		if all_files is None:
+			try:
+				ti = self.torrent_info_for(t_hash, handle, st)
+				if ti is None:
+					raise ValueError
+				files = ti.files()
+				all_files = [
+					(i, file_path_parts(files.file_path(i)), files.file_size(i))
+					for i in range(ti.num_files())
+				]
+			except Exception:
+				self._files_key = None
+				self._files_handle = None
+				self._all_files = []
+				self._files_rows = {}
+				self.files_tree.delete(*self.files_tree.get_children())
+				self.files_tree.insert('', tk.END, values=("Metadata not available.", "", "", ""))
+				return
+			self._files_cache[t_hash] = all_files
 
-	def update_files_info(self, handle):
-		for item in self.files_tree.get_children():
-			self.files_tree.delete(item)
-		st = handle.status()
-		if not getattr(st, "has_metadata", False):
-			self.files_tree.insert('', tk.END, values=("Metadata not available.", "", "", ""))
+		pieces = getattr(st, 'num_pieces', None)
+		if t_hash == self._files_key and self._files_rows:
+			self.refresh_files_window(pieces)
 			return
+		self._all_files = all_files
+		self._files_key = t_hash
+		self._files_window_start = 0
+		self._files_handle = handle
+		self.render_files_window(pieces=pieces)
+
+	def cached_file_progress(self, handle, pieces=None):
+		# file_progress() marshals one int per file; reuse it until another piece completes
+		t_hash = self._files_key or safe_info_hash_str(handle)
+		old_pieces, old_list = self._file_progress_cache.get(t_hash, (-1, None))
+		if old_list is not None and (pieces is None or pieces == old_pieces):
+			return old_list
 		try:
-			ti = handle.get_torrent_info()
-			files = ti.files()
+			new_list = handle.file_progress(0)
 		except Exception:
-			self.files_tree.insert('', tk.END, values=("Metadata not available.", "", "", ""))
+			return old_list or []
+		self._file_progress_cache[t_hash] = (pieces if pieces is not None else -1, new_list)
+		return new_list
+
+	def render_files_window(self, yview=None, pieces=None):
+		# Only FILES_WINDOW_SIZE files live in the Treeview; scrolling slides the window
+		handle = self._files_handle
+		tree = self.files_tree
+		if yview is None:
+			yview = tree.yview()[0]
+		# One Tcl call for the whole clear instead of one per row
+		tree.delete(*tree.get_children())
+		if handle is None:
 			return
+		start = self._files_window_start
+		window = self._all_files[start:start + FILES_WINDOW_SIZE]
+		leaf_values = self._file_leaf_values(handle, pieces)
+		rendered = {}
+
+		def leaf(file_index):
+			values = rendered[file_index] = leaf_values(file_index)
+			return values
+
+		rows = insert_file_rows(tree, ((i, parts) for i, parts, _ in window), ("", "", ""), leaf)
+		self._files_rows = {i: (iid, rendered[i]) for i, iid in rows.items()}
 		try:
-			file_progress_bytes = handle.file_progress(0)
+			tree.yview_moveto(yview)
 		except Exception:
-			file_progress_bytes = []
+			pass
 
-		tree_items = {}
-		def insert_recursive(path_parts, current_parent_id, file_index=-1):
-			if not path_parts:
-				return
-			part = path_parts[0]
-			current_id = f"{current_parent_id}/{part}" if current_parent_id else part
-			if current_id not in tree_items:
-				if len(path_parts) == 1 and file_index != -1:
-					file_size = files.file_size(file_index)
-					progress_pct = ""
-					try:
-						if file_progress_bytes and file_index < len(file_progress_bytes):
-							pb = max(0, min(file_progress_bytes[file_index], file_size))
-							progress_pct = f"{(pb / file_size * 100) if file_size > 0 else 0:.1f}%"
-					except Exception:
-						progress_pct = ""
-					file_priority = self.safe_get_file_priority(handle, file_index)
-					item_id = self.files_tree.insert(
-						current_parent_id,
-						tk.END,
-						text=part,
-						values=(self.format_bytes(file_size), progress_pct, self.get_priority_text(file_priority)),
-						tags=(str(file_index), 'file')
-					)
-					tree_items[current_id] = item_id
-				else:
-					item_id = self.files_tree.insert(current_parent_id, tk.END, text=part, open=True, values=("", "", ""))
-					tree_items[current_id] = item_id
-			if len(path_parts) > 1:
-				insert_recursive(path_parts[1:], tree_items[current_id], file_index)
+	def _file_leaf_values(self, handle, pieces=None):
+		file_progress_bytes = self.cached_file_progress(handle, pieces)
+		n_progress = len(file_progress_bytes)
+		all_files = self._all_files
+
+		def leaf_values(file_index):
+			file_size = all_files[file_index][2]
+			progress_pct = ""
+			try:
+				if file_index < n_progress:
+					pb = max(0, min(file_progress_bytes[file_index], file_size))
+					progress_pct = f"{(pb / file_size * 100) if file_size > 0 else 0:.1f}%"
+			except Exception:
+				progress_pct = ""
+			file_priority = self.safe_get_file_priority(handle, file_index)
+			return (self.format_bytes(file_size), progress_pct, self.get_priority_text(file_priority))
+		return leaf_values
+
+	def refresh_files_window(self, pieces=None):
+		# Same torrent and window: rewrite only the file rows whose values changed
+		handle = self._files_handle
+		if handle is None:
+			return
+		leaf_values = self._file_leaf_values(handle, pieces)
+		rows = self._files_rows
+		for file_index, (iid, old_values) in list(rows.items()):
+			values = leaf_values(file_index)
+			if values != old_values:
+				try:
+					self.files_tree.item(iid, values=values)
+				except Exception:
+					continue
+				rows[file_index] = (iid, values)
 
-		for i in range(ti.num_files()):
-			file_path = str(Path(files.file_path(i)))
-			insert_recursive(file_path.split(os.sep), '', i)
+	def on_files_yscroll(self, first, last):
+		self._files_v_scroll.set(first, last)
+		# Wheel, scrollbar drags, keyboard moves and resizes all report here;
+		# reaching an edge of the window slides it once Tk is idle
+		if self._files_slide_pending or len(self._all_files) <= FILES_WINDOW_SIZE:
+			return
+		if float(first) <= 0.0 or float(last) >= 1.0:
+			self._files_slide_pending = True
+			self.root.after_idle(self.slide_files_window)
+
+	def slide_files_window(self):
+		self._files_slide_pending = False
+		total = len(self._all_files)
+		if total <= FILES_WINDOW_SIZE:
+			return
+		tree = self.files_tree
+		# Re-read the view: the reported edge may have been a transient during a re-render
+		top, bottom = tree.yview()
+		start = self._files_window_start
+		step = FILES_WINDOW_SIZE // 2
+		if bottom >= 1.0 and top > 0.0 and start + FILES_WINDOW_SIZE < total:
+			self._files_window_start = min(start + step, total - FILES_WINDOW_SIZE)
+		elif top <= 0.0 and bottom < 1.0 and start > 0:
+			self._files_window_start = max(0, start - step)
+		else:
+			return
+		# Keep keyboard focus (and selection) on the same file across the re-render
+		focus = tree.focus()
+		selected = focus in tree.selection() if focus else False
+		focus_index = next((i for i, (iid, _) in self._files_rows.items() if iid == focus), None)
+		self.render_files_window(yview=0.4)
+		row = self._files_rows.get(focus_index)
+		if row is not None:
+			try:
+				tree.focus(row[0])
+				if selected:
+					tree.selection_set(row[0])
+				tree.see(row[0])
+			except Exception:
+				pass
 
 	def safe_get_file_priority(self, handle, file_index: int) -> int:
 		try:
@@ -1359,20 +2123,22 @@ Comment: {(torrent_info.comment() if torrent_info and hasattr(torrent_info, 'com
 			return FILE_PRIORITY_NORMAL
 
 	def update_peers_info(self, handle):
-		for item in self.peers_tree.get_children():
-			self.peers_tree.delete(item)
+		self.peers_tree.delete(*self.peers_tree.get_children())
 		try:
 			peers = handle.get_peer_info()
+			insert = self.peers_tree.insert
+			format_speed = self.format_speed
+			format_peer_flags = self.format_peer_flags
 			for p in peers:
 				try:
 					ip_obj = getattr(p, "ip", None)
 					ip_text = str(ip_obj[0]) if isinstance(ip_obj, tuple) else str(ip_obj)
 					client = getattr(p, "client", "")
 					prog = f"{getattr(p, 'progress', 0.0) * 100:.1f}%"
-					ds = self.format_speed(getattr(p, "down_speed", 0))
-					us = self.format_speed(getattr(p, "up_speed", 0))
-					flags = self.format_peer_flags(getattr(p, "flags", 0))
-					self.peers_tree.insert('', tk.END, values=(ip_text, client, prog, ds, us, flags))
+					ds = format_speed(getattr(p, "down_speed", 0))
+					us = format_speed(getattr(p, "up_speed", 0))
+					flags = format_peer_flags(getattr(p, "flags", 0))
+					insert('', tk.END, values=(ip_text, client, prog, ds, us, flags))
 				except Exception:
 					continue
 		except Exception as e:
@@ -1380,71 +2146,38 @@ Comment: {(torrent_info.comment() if torrent_info and hasattr(torrent_info, 'com
 
 	def format_peer_flags(self, flags: int) -> str:
 		try:
-			out = []
-			if flags & lt.peer_info.interesting: out.append("I")
-			if flags & lt.peer_info.choked: out.append("C")
-			if flags & lt.peer_info.remote_interested: out.append("i")
-			if flags & lt.peer_info.remote_choked: out.append("c")
-			if flags & lt.peer_info.supports_extensions: out.append("E")
-			if flags & lt.peer_info.handshake: out.append("H")
-			if flags & lt.peer_info.connecting: out.append("X")
-			if flags & lt.peer_info.queued: out.append("Q")
-			if hasattr(lt.peer_info, "on_parole") and (flags & lt.peer_info.on_parole): out.append("P")
-			if flags & lt.peer_info.seed: out.append("S")
-			if flags & lt.peer_info.optimistic_unchoke: out.append("O")
-			if flags & lt.peer_info.snubbed: out.append("U")
-			if hasattr(lt.peer_info, "upload_only") and (flags & lt.peer_info.upload_only): out.append("D")
-			if hasattr(lt.peer_info, "endgame_mode") and (flags & lt.peer_info.endgame_mode): out.append("F")
-			if hasattr(lt.peer_info, "holepunched") and (flags & lt.peer_info.holepunched): out.append("L")
-			if hasattr(lt.peer_info, "i2p_peer") and (flags & lt.peer_info.i2p_peer): out.append("Z")
-			if hasattr(lt.peer_info, "utp_peer") and (flags & lt.peer_info.utp_peer): out.append("T")
-			if hasattr(lt.peer_info, "webrtc_peer") and (flags & lt.peer_info.webrtc_peer): out.append("W")
-			if flags & lt.peer_info.outgoing: out.append("O")
-			return "".join(out) if out else "-"
+			return "".join([letter for mask, letter in PEER_FLAG_TABLE if flags & mask]) or "-"
 		except Exception:
 			return "-"
 
 	def update_trackers_info(self, handle):
-		for item in self.trackers_tree.get_children():
-			self.trackers_tree.delete(item)
+		self.trackers_tree.delete(*self.trackers_tree.get_children())
 		try:
 			entries = handle.trackers()
+			insert = self.trackers_tree.insert
 			for tr in entries:
 				url = getattr(tr, "url", "")
 				msg = getattr(tr, "message", "")
-				self.trackers_tree.insert('', tk.END, values=(url, msg))
+				insert('', tk.END, values=(url, msg))
 		except Exception as e:
 			self.log(f"Trackers error: {e}")
 
 	def update_status_bar(self):
 		total_down = 0
 		total_up = 0
-		try:
-			for h in self.session.get_torrents():
-				if h.is_valid():
-					st = h.status()
-					total_down += getattr(st, "download_rate", 0)
-					total_up += getattr(st, "upload_rate", 0)
-		except Exception:
-			pass
-
-		try:
-			sst = self.session.status()
-			dht_nodes = getattr(sst, "dht_nodes", 0)
-		except Exception:
-			dht_nodes = 0
-
 		total_wanted_all = 0
 		total_done_all = 0
 		try:
-			for h in self.session.get_torrents():
-				if h.is_valid():
-					st = h.status()
-					total_wanted_all += getattr(st, "total_wanted", 0)
-					total_done_all += getattr(st, "total_done", 0)
+			for st in self._status_cache.values():
+				total_down += st.download_rate
+				total_up += st.upload_rate
+				total_wanted_all += st.total_wanted
+				total_done_all += st.total_done
 		except Exception:
 			pass
 
+		dht_nodes = getattr(self.tick_session_status(), "dht_nodes", 0)
+
 		progress = (total_done_all / total_wanted_all * 100) if total_wanted_all > 0 else 0.0
 
 		self.speed_label.config(text=f"↓ {self.format_speed(total_down)} ↑ {self.format_speed(total_up)}")
@@ -1452,29 +2185,28 @@ Comment: {(torrent_info.comment() if torrent_info and hasattr(torrent_info, 'com
 		self.status_label.config(text=f"Torrents: {len(self.torrents)}")
 		self.progress_bar['value'] = progress
 
-	def update_performance_stats(self):
-		try:
-			sst = self.session.status()
-			self.performance_stats['download_speeds'].append(getattr(sst, 'download_rate', 0))
-			self.performance_stats['upload_speeds'].append(getattr(sst, 'upload_rate', 0))
-		except Exception:
-			self.performance_stats['download_speeds'].append(0)
-			self.performance_stats['upload_speeds'].append(0)
-
-		try:
-			process = psutil.Process(os.getpid())
-			mem = process.memory_info().rss
-			self.performance_stats['memory_usage'].append(mem)
-			self.performance_stats['cpu_usage'].append(process.cpu_percent(interval=None))
-		except Exception:
-			self.performance_stats['memory_usage'].append(0)
-			self.performance_stats['cpu_usage'].append(0)
+	def tick_session_status(self):
+		# One session.status() crossing per GUI tick; None when the session cannot report
+		sst = self._tick_sst
+		if sst is None:
+			try:
+				sst = self.session.status()
+			except Exception:
+				sst = False
+			self._tick_sst = sst
+		return sst or None
 
-		self.update_performance_tab()
+	def update_performance_stats(self):
+		# One sample row per tick, written column by column into the parallel rings
+		sst = self.tick_session_status()
+		cpu, rss = self._perf_cache
+		row = (getattr(sst, 'download_rate', 0), getattr(sst, 'upload_rate', 0), rss, cpu)
+		for ring, value in zip(self._perf_rings, row):
+			ring.append(value)
 
 	def update_performance_tab(self):
+		sst = self.tick_session_status()
 		try:
-			sst = self.session.status()
 			self.dl_stats_label.config(text=f"Total: {self.format_bytes(getattr(sst, 'total_download', 0))}, Rate: {self.format_speed(getattr(sst, 'download_rate', 0))}")
 			self.ul_stats_label.config(text=f"Total: {self.format_bytes(getattr(sst, 'total_upload', 0))}, Rate: {self.format_speed(getattr(sst, 'upload_rate', 0))}")
 			self.conn_stats_label.config(text=f"Active: {getattr(sst, 'num_peers', 0)}")
@@ -1484,8 +2216,7 @@ Comment: {(torrent_info.comment() if torrent_info and hasattr(torrent_info, 'com
 			self.conn_stats_label.config(text="Active: 0")
 
 		try:
-			process = psutil.Process(os.getpid())
-			m = process.memory_info().rss
+			m = self._perf_cache[1]
 			self.mem_stats_label.config(text=f"Usage: {self.format_bytes(m)}")
 			cur_cpu = self.performance_stats['cpu_usage'][-1] if self.performance_stats['cpu_usage'] else 0.0
 			self.cpu_stats_label.config(text=f"Current: {cur_cpu:.1f}%")
@@ -1494,7 +2225,8 @@ Comment: {(torrent_info.comment() if torrent_info and hasattr(torrent_info, 'com
 			self.cpu_stats_label.config(text="Current: N/A")
 
 		try:
-			sst = self.session.status()
+			if sst is None:
+				raise ValueError
 			stats_text = f"""Session Uptime: {self.format_time(int(getattr(sst, 'uptime', 0)))}
 Total Download: {self.format_bytes(getattr(sst, 'total_download', 0))}
 Total Upload: {self.format_bytes(getattr(sst, 'total_upload', 0))}
@@ -1507,10 +2239,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		except Exception:
 			stats_text = "No session stats available."
 
-		self.perf_text.config(state=tk.NORMAL)
-		self.perf_text.delete(1.0, tk.END)
-		self.perf_text.insert(tk.END, stats_text)
-		self.perf_text.config(state=tk.DISABLED)
+		self.set_readonly_text(self.perf_text, '_last_perf_text', stats_text)
 
 	def update_live_status(self):
 		now = time.time()
@@ -1519,14 +2248,19 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		if now - self._last_live_status_render < 0.5:
 			return
 		self._last_live_status_render = now
+		# No new statuses since the last render means the text would be identical
+		sig = (self._status_gen, len(self.torrents))
+		if sig == self._last_live_sig:
+			return
+		self._last_live_sig = sig
 		lines = []
 		line_map = {}
 		line_no = 1
 		for hsh, info in self.torrents.items():
-			h = info['handle']
+			h = info.handle
 			try:
-				st = h.status()
-				name = getattr(st, 'name', '') or (h.name() if lt_has(h, 'name') else hsh[:10])
+				st = self._status_cache.get(hsh) or h.status()
+				name = getattr(st, 'name', '') or (h.name() if 'name' in self._handle_caps else hsh[:10])
 				state = self.get_status_text(st)
 				prog = f"{getattr(st, 'progress', 0.0) * 100:.1f}%"
 				ds = self.format_speed(getattr(st, 'download_rate', 0))
@@ -1538,14 +2272,16 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 				continue
 		self._live_status_line_to_hash = line_map
 		try:
-			self.live_status_text.config(state=tk.NORMAL)
-			self.live_status_text.delete(1.0, tk.END)
-			self.live_status_text.insert(tk.END, "\n".join(lines) if lines else "No torrents yet.")
-			self.live_status_text.config(state=tk.DISABLED)
+			self.set_readonly_text(self.live_status_text, '_last_live_text', "\n".join(lines) if lines else "No torrents yet.")
 		except Exception:
 			pass
 
 	def auto_move_completed(self):
+		# Completion rarely changes; scan every ~10s. libtorrent moves the storage itself when it can
+		now = time.monotonic()
+		if now - self._last_move_check < 10.0:
+			return
+		self._last_move_check = now
 		# Completed path root
 		completed_root = Path(self.config.get('completed_path', str(platform_downloads_dir() / "Completed")))
 		try:
@@ -1553,21 +2289,23 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		except Exception:
 			return
 		for hsh, info in list(self.torrents.items()):
-			handle = info['handle']
+			if info.moved or hsh in self._moves_in_flight:
+				continue
+			handle = info.handle
 			try:
-				st = handle.status()
+				st = self._status_cache.get(hsh) or handle.status()
 				is_done = getattr(st, 'is_seeding', False) or getattr(st, 'state', None) == lt.torrent_status.seeding or getattr(st, 'progress', 0.0) >= 0.999
-				if is_done and not info.get('moved', False):
-					base_save_path = Path(getattr(st, 'save_path', info['save_path'])).resolve()
+				if is_done:
+					base_save_path = Path(getattr(st, 'save_path', info.save_path)).resolve()
 					# If completed_root is the same as base_save_path or inside it, skip auto move to avoid self-move
 					try:
 						if completed_root.resolve() == base_save_path or str(completed_root.resolve()).startswith(str((base_save_path / '').resolve())):
 							self.log("Auto-move skipped: Completed path is within save path.")
-							info['moved'] = True
+							info.moved = True
 							continue
 					except Exception:
 						pass
-					name = getattr(st, 'name', None) or (handle.name() if lt_has(handle, 'name') else hsh)
+					name = getattr(st, 'name', None) or (handle.name() if 'name' in self._handle_caps else hsh)
 					if not name:
 						continue
 					src_content = (base_save_path / name).resolve()
@@ -1582,33 +2320,78 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 					try:
 						if str(target).startswith(str(src_content)):
 							self.log("Auto-move skipped: target would be inside source.")
-							info['moved'] = True
+							info.moved = True
 							continue
 					except Exception:
 						pass
 
-					try:
-						target.parent.mkdir(parents=True, exist_ok=True)
-						shutil.move(str(src_content), str(target))
-						info['moved'] = True
-						self.log(f"Auto-moved completed to: {target}")
-					except Exception as me:
-						self.log(f"Auto-move failed: {me}")
+					self._moves_in_flight.add(hsh)
+					if 'move_storage' in self._handle_caps:
+						# Renames in place on the same filesystem, copies on libtorrent's disk thread otherwise;
+						# completion is reported by storage_moved_alert / storage_moved_failed_alert
+						handle.move_storage(str(completed_root))
+					else:
+						fut = self._io_pool.submit(self._move_content, src_content, target)
+						fut.add_done_callback(lambda f, h=hsh, t=target: self._queue_move_result(h, f, t))
 			except Exception:
+				self._moves_in_flight.discard(hsh)
 				continue
 
+	@staticmethod
+	def _move_content(src, target):
+		target.parent.mkdir(parents=True, exist_ok=True)
+		shutil.move(str(src), str(target))
+
+	def _queue_move_result(self, t_hash, fut, target):
+		# Runs on the pool thread and must not call into Tk: on_closing blocks the Tk thread
+		# in _io_pool.shutdown(wait=True), so a root.after here could never be serviced.
+		# The result joins the storage_moved alerts that update_torrent_list already drains.
+		try:
+			err = fut.exception()
+		except Exception as e:
+			err = e
+		with self._alert_lock:
+			self._pending_moved.append((t_hash, target.parent, str(err) if err is not None else None))
+
+	def _finish_move(self, t_hash, save_path, error=None):
+		self._moves_in_flight.discard(t_hash)
+		if error is not None:
+			self.log(f"Auto-move failed: {error}")
+			return
+		entry = self.torrents.get(t_hash)
+		if entry is not None:
+			entry.moved = True
+			entry.save_path = str(save_path)
+		self.log(f"Auto-moved completed to: {save_path}")
+
 	def refresh_filter_view(self):
-		hide_completed = self.hide_completed_var.get()
-		for item in self.tree.get_children():
-			values = self.tree.item(item)['values']
-			if not hide_completed:
-				self.tree.reattach(item, '', tk.END)
-				continue
-			status_text = values[3] if len(values) > 3 else ""
-			if any(s in str(status_text) for s in ("Finished", "Seeding")):
-				self.tree.detach(item)
-			else:
-				self.tree.reattach(item, '', tk.END)
+		for t_hash, item in self._tree_items.items():
+			self._apply_row_visibility(t_hash, item)
+
+	def on_hide_completed_toggled(self):
+		# Only completed rows can change visibility when this toggle flips
+		items = self._tree_items
+		for t_hash, done in self._completion_state.items():
+			if done and t_hash in items:
+				self._apply_row_visibility(t_hash, items[t_hash])
+
+	def _row_visible(self, t_hash):
+		if self.hide_completed_var.get() and self._completion_state.get(t_hash, False):
+			return False
+		needle = self._search_needle
+		return not needle or needle in self._row_search_text.get(t_hash, "")
+
+	def _apply_row_visibility(self, t_hash, item):
+		# Touch Tk only when the row's visibility actually changes
+		visible = self._row_visible(t_hash)
+		if visible == (t_hash not in self._hidden_rows):
+			return
+		if visible:
+			self._hidden_rows.discard(t_hash)
+			self.tree.reattach(item, '', tk.END)
+		else:
+			self._hidden_rows.add(t_hash)
+			self.tree.detach(item)
 
 	def start_selected(self):
 		item = self.get_single_selection()
@@ -1619,9 +2402,9 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 			return
 		try:
 			h.resume()
-			if lt_has(h, 'set_upload_mode'):
+			if 'set_upload_mode' in self._handle_caps:
 				h.set_upload_mode(False)
-			self.log(f"Started: {h.name() if lt_has(h, 'name') else ''}")
+			self.log(f"Started: {h.name() if 'name' in self._handle_caps else ''}")
 		except Exception as e:
 			self.log(f"Start error: {e}")
 
@@ -1634,7 +2417,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 			return
 		try:
 			h.pause()
-			self.log(f"Paused: {h.name() if lt_has(h, 'name') else ''}")
+			self.log(f"Paused: {h.name() if 'name' in self._handle_caps else ''}")
 		except Exception as e:
 			self.log(f"Pause error: {e}")
 
@@ -1646,7 +2429,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		if not h:
 			return
 		try:
-			if lt_has(h, 'set_upload_mode'):
+			if 'set_upload_mode' in self._handle_caps:
 				h.set_upload_mode(True)
 			h.pause()
 			self.log("Stopped (seeding halted)")
@@ -1661,7 +2444,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		if not h:
 			return
 		try:
-			if lt_has(h, 'set_upload_mode'):
+			if 'set_upload_mode' in self._handle_caps:
 				h.set_upload_mode(False)
 			h.resume()
 			self.log("Forced resume")
@@ -1678,13 +2461,13 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		try:
 			st = h.status()
 			if getattr(st, "paused", False):
-				if lt_has(h, 'set_upload_mode'):
+				if 'set_upload_mode' in self._handle_caps:
 					h.set_upload_mode(False)
 				h.resume()
-				self.log(f"Resumed: {h.name() if lt_has(h, 'name') else ''}")
+				self.log(f"Resumed: {h.name() if 'name' in self._handle_caps else ''}")
 			else:
 				h.pause()
-				self.log(f"Paused: {h.name() if lt_has(h, 'name') else ''}")
+				self.log(f"Paused: {h.name() if 'name' in self._handle_caps else ''}")
 		except Exception as e:
 			self.log(f"Toggle pause error: {e}")
 
@@ -1717,7 +2500,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 					self.session.remove_torrent(h)
 					try:
 						st = h.status()
-						name = getattr(st, 'name', '') or (h.name() if lt_has(h, 'name') else '')
+						name = getattr(st, 'name', '') or (h.name() if 'name' in self._handle_caps else '')
 						base = Path(getattr(st, 'save_path', ''))
 						target = (base / name) if name else base
 						if target.exists():
@@ -1731,7 +2514,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 				self.session.remove_torrent(h)
 			t_hash = self.tree.item(item)['tags'][0]
 			self.torrents.pop(t_hash, None)
-			self.tree.delete(item)
+			self.remove_tree_item(t_hash)
 			self.log("Removed torrent" + (" and data" if delete_data else ""))
 		except Exception as e:
 			self.log(f"Remove error: {e}")
@@ -1753,7 +2536,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 			return
 		dest_path = Path(dest)
 		try:
-			name = getattr(st, 'name', None) or (h.name() if lt_has(h, 'name') else safe_info_hash_str(h))
+			name = getattr(st, 'name', None) or (h.name() if 'name' in self._handle_caps else safe_info_hash_str(h))
 			if not name:
 				messagebox.showinfo("Save As", "Cannot resolve content name yet.")
 				return
@@ -1811,7 +2594,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		if not h:
 			return
 		st = h.status()
-		content_name = getattr(st, "name", "") or (h.name() if lt_has(h, 'name') else "")
+		content_name = getattr(st, "name", "") or (h.name() if 'name' in self._handle_caps else "")
 		save_path = Path(getattr(st, "save_path", ""))
 		target = save_path if not content_name else (save_path / content_name)
 		if target.exists():
@@ -1835,7 +2618,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 			return
 		try:
 			st = h.status()
-			name = getattr(st, "name", "") or (h.name() if lt_has(h, 'name') else "")
+			name = getattr(st, "name", "") or (h.name() if 'name' in self._handle_caps else "")
 			base = Path(getattr(st, "save_path", ""))
 			if name:
 				target = base / name
@@ -1858,14 +2641,32 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		if not h:
 			return
 		try:
-			if getattr(h.status(), "has_metadata", False):
-				info = h.get_torrent_info()
+			t_hash = safe_info_hash_str(h)
+			info = self.torrent_info_for(t_hash, h)
+			if info is not None:
 				magnet_link = lt.make_magnet_uri(info)
-				self.root.clipboard_clear()
-				self.root.clipboard_append(magnet_link)
-				self.log(f"Magnet copied: {magnet_link[:64]}...")
 			else:
-				messagebox.showinfo("Info", "Metadata not available yet.")
+				# No metadata yet: the info-hash form is enough to share right away
+				try:
+					magnet_link = lt.make_magnet_uri(h)
+				except Exception:
+					magnet_link = None
+				if not magnet_link:
+					xt = magnet_xt(h)
+					if xt is None:
+						messagebox.showinfo("Info", "Metadata not available yet.")
+						return
+					magnet_link = f"magnet:?xt={xt}"
+					try:
+						for tr in h.trackers():
+							url = tr.get('url') if isinstance(tr, dict) else getattr(tr, 'url', '')
+							if url:
+								magnet_link += "&tr=" + quote(url, safe='')
+					except Exception:
+						pass
+			self.root.clipboard_clear()
+			self.root.clipboard_append(magnet_link)
+			self.log(f"Magnet copied: {magnet_link[:64]}...")
 		except Exception as e:
 			self.log(f"Copy magnet error: {e}")
 
@@ -1912,7 +2713,8 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		if not tags:
 			return None
 		t_hash = tags[0]
-		return self.torrents.get(t_hash, {}).get('handle')
+		entry = self.torrents.get(t_hash)
+		return entry.handle if entry else None
 
 	def apply_speed_limits_toolbar(self):
 		try:
@@ -2020,14 +2822,14 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		info = self.torrents.get(t_hash)
 		if not info:
 			return
-		h = info.get('handle')
+		h = info.handle
 		if not h:
 			return
 		try:
-			if lt_has(h, 'set_upload_mode'):
+			if 'set_upload_mode' in self._handle_caps:
 				h.set_upload_mode(True)
 			h.pause()
-			self.log(f"Stopped: {getattr(h.status(), 'name', '') or (h.name() if lt_has(h, 'name') else t_hash[:10])}")
+			self.log(f"Stopped: {getattr(h.status(), 'name', '') or (h.name() if 'name' in self._handle_caps else t_hash[:10])}")
 		except Exception as e:
 			self.log(f"Stop error: {e}")
 
@@ -2035,7 +2837,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		info = self.torrents.get(t_hash)
 		if not info:
 			return
-		h = info.get('handle')
+		h = info.handle
 		if not h:
 			return
 		try:
@@ -2047,11 +2849,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 					self.session.remove_torrent(h)
 			else:
 				self.session.remove_torrent(h)
-			for item in self.tree.get_children():
-				tags = self.tree.item(item)['tags']
-				if tags and tags[0] == t_hash:
-					self.tree.delete(item)
-					break
+			self.remove_tree_item(t_hash)
 			self.torrents.pop(t_hash, None)
 			self.log("Removed via Live menu" + (" and data" if delete_data else ""))
 		except Exception as e:
@@ -2072,12 +2870,7 @@ DHT Nodes: {getattr(sst, 'dht_nodes', 0)}
 		except Exception:
 			pass
 
-		session_set_max_connections(self.session, self.config.get('max_connections', 4000))
-		session_set_max_uploads(self.session, self.config.get('max_uploads', 1000))
-		session_set_download_rate_limit(self.session, self.config.get('global_dl_limit', 0))
-		session_set_upload_rate_limit(self.session, self.config.get('global_ul_limit', 0))
-
-		self.apply_speed_tuning()
+		self.apply_session_limits()
 
 		port_range = self.config.get('port_range', [6881, 6891])
 		if session_listen_on(self.session, port_range[0], port_range[1]):
@@ -2131,6 +2924,8 @@ Tkinter: {tk.TkVersion}
 			self.live_status_text.config(state=tk.NORMAL)
 			self.live_status_text.delete(1.0, tk.END)
 			self.live_status_text.config(state=tk.DISABLED)
+			self._last_live_text = None
+			self._last_live_sig = None
 		except Exception:
 			pass
 		self.log("All logs cleared (Log + Live)")
@@ -2168,74 +2963,62 @@ Tkinter: {tk.TkVersion}
 				messagebox.showerror("Error", f"Failed to export: {e}")
 
 	def filter_torrents(self, event=None):
-		search_term = (self.search_var.get() or "").lower()
-		for item in self.tree.get_children():
-			values = self.tree.item(item)['values']
-			tags = self.tree.item(item)['tags']
-			match = any(search_term in str(v).lower() for v in values)
-			if not match and tags:
-				if search_term in tags[0][:16].lower():
-					match = True
-			if match:
-				self.tree.reattach(item, '', tk.END)
-			else:
-				self.tree.detach(item)
+		# Debounce keystrokes; the filter runs once typing pauses
+		if self._search_after:
+			try: self.root.after_cancel(self._search_after)
+			except Exception: pass
+		self._search_after = self.root.after(SEARCH_DEBOUNCE_MS, self._do_filter)
+
+	def _maybe_filter(self):
+		needle = (self.search_var.get() or "").lower()
+		if needle == self._search_needle:
+			# Edited back to the applied query: drop any pending re-filter
+			if self._search_after:
+				try: self.root.after_cancel(self._search_after)
+				except Exception: pass
+				self._search_after = None
+			return
+		self.filter_torrents()
 
-	def sort_treeview(self, col):
-		numeric_cols = ['Size', 'Progress', 'Seeds', 'Peers', 'Down Speed', 'Up Speed', 'ETA', 'Ratio']
-		rows = [(self.tree.set(k, col), k) for k in self.tree.get_children('')]
-		def parse_human(value_str):
-			if value_str in ("0 B", "0 B/s"):
-				return 0
-			try:
-				sign = -1 if str(value_str).startswith('-') else 1
-				s = str(value_str).lstrip('-').replace('/s', '')
-				num_str, unit = s.split(' ')
-				num = float(num_str)
-				unit_map = {'B':1, 'KB':1024, 'MB':1024**2, 'GB':1024**3, 'TB':1024**4, 'PB':1024**5}
-				return sign * num * unit_map.get(unit, 1)
-			except Exception:
-				return float('inf')
-		def parse_eta(eta_str):
-			if eta_str == "∞":
-				return float('inf')
-			total = 0
-			for part in str(eta_str).split(' '):
-				if part.endswith('d'): total += int(part[:-1]) * 86400
-				elif part.endswith('h'): total += int(part[:-1]) * 3600
-				elif part.endswith('m'): total += int(part[:-1]) * 60
-				elif part.endswith('s'): total += int(part[:-1])
-			return total
-		try:
-			if col in numeric_cols:
-				if col in ['Size', 'Down Speed', 'Up Speed']:
-					rows.sort(key=lambda t: parse_human(t[0]))
-				elif col == 'Progress':
-					rows.sort(key=lambda t: float(str(t[0]).rstrip('%') or 0.0))
-				elif col == 'ETA':
-					rows.sort(key=lambda t: parse_eta(t[0]))
-				elif col == 'Ratio':
-					rows.sort(key=lambda t: float(t[0] or 0.0))
-				elif col in ['Seeds', 'Peers']:
-					head = lambda s: (str(s).split(' ') or ['0'])[0]
-					rows.sort(key=lambda t: int(head(t[0])) if head(t[0]).isdigit() else -1)
-			else:
-				rows.sort(key=lambda t: str(t[0]).lower())
-		except Exception:
-			rows.sort(key=lambda t: str(t[0]).lower())
+	def _do_filter(self):
+		self._search_after = None
+		needle = (self.search_var.get() or "").lower()
+		if needle == self._search_needle:
+			return
+		self._search_needle = needle
+		self.refresh_filter_view()
 
-		if hasattr(self, '_sort_column') and self._sort_column == col:
-			if getattr(self, '_sort_reverse', False):
-				rows.reverse()
-				self._sort_reverse = False
-			else:
-				self._sort_reverse = True
+	def sort_treeview(self, col):
+		idx = SORT_COLUMN_INDEX.get(col)
+		if idx is None:
+			return
+		# Parallel key/iid columns pulled once from the tuples update_tree_item
+		# already parsed; the sort then ranks indices, no per-row tuples
+		keys = self._sort_keys
+		hidden = self._hidden_rows
+		col_keys = []
+		iids = []
+		for h, iid in self._tree_items.items():
+			k = keys.get(h)
+			if k is not None and h not in hidden:
+				col_keys.append(k[idx])
+				iids.append(iid)
+
+		# Clicking the same column again flips the direction
+		descending = False
+		if getattr(self, '_sort_column', None) == col:
+			descending = not getattr(self, '_sort_reverse', False)
+			self._sort_reverse = descending
 		else:
 			self._sort_column = col
 			self._sort_reverse = False
+		order = sorted(range(len(iids)), key=col_keys.__getitem__, reverse=descending)
 
-		for idx, (_, k) in enumerate(rows):
-			self.tree.move(k, '', idx)
+		# One Tcl call reorders every attached row instead of one move() per row,
+		# and none at all when the rows are already in this order
+		ordered = tuple(iids[i] for i in order)
+		if self.tree.get_children('') != ordered:
+			self.tree.set_children('', *ordered)
 
 	def load_config(self):
 		config_file = "torrent_client_config.json"
@@ -2280,66 +3063,34 @@ Tkinter: {tk.TkVersion}
 
 	def save_config(self):
 		try:
-			with open("torrent_client_config.json", 'w', encoding='utf-8') as f:
-				json.dump(self.config, f, indent=2)
+			write_file_atomic("torrent_client_config.json", dumps_json_pretty(self.config))
 		except Exception as e:
 			self.log(f"Config save error: {e}")
 
 	def format_bytes(self, bytes_value):
-		try:
-			v = float(bytes_value)
-		except Exception:
-			v = 0.0
-		if v == 0:
-			return "0 B"
-		units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-		i = 0
-		abs_v = abs(v)
-		while abs_v >= 1024 and i < len(units) - 1:
-			abs_v /= 1024.0
-			i += 1
-		sign = "-" if v < 0 else ""
-		return f"{sign}{abs_v:.1f} {units[i]}"
+		return format_bytes_any(bytes_value)
 
 	def format_speed(self, bytes_per_second):
+		if type(bytes_per_second) is int:
+			return _format_speed_int(bytes_per_second)
 		return f"{self.format_bytes(bytes_per_second)}/s"
 
 	def format_time(self, seconds):
-		s = int(seconds)
-		if s <= 0:
-			return "0s"
-		d, rem = divmod(s, 86400)
-		h, rem = divmod(rem, 3600)
-		m, s = divmod(rem, 60)
-		parts = []
-		if d: parts.append(f"{d}d")
-		if h: parts.append(f"{h}h")
-		if m: parts.append(f"{m}m")
-		if s or not parts: parts.append(f"{s}s")
-		return " ".join(parts)
+		seconds = int(seconds)
+		# Sub-minute ETAs are the common case; skip the cache lookup for them
+		if seconds < 60:
+			return f"{seconds}s" if seconds > 0 else "0s"
+		return _format_time_int(seconds)
 
 	def get_status_text(self, status):
 		try:
 			if getattr(status, "paused", False):
 				return "Paused"
 			st = getattr(status, "state", None)
-			if st == lt.torrent_status.queued_for_checking:
-				return "Queued"
-			elif st == lt.torrent_status.checking_files:
-				return "Checking"
-			elif st == lt.torrent_status.downloading_metadata:
-				return "Metadata"
-			elif st == lt.torrent_status.downloading:
-				return "Downloading"
-			elif st == lt.torrent_status.finished:
-				return "Finished"
-			elif st == lt.torrent_status.seeding:
-				return "Seeding"
-			elif st == lt.torrent_status.allocating:
-				return "Allocating"
-			elif st == lt.torrent_status.checking_resume_data:
-				return "Checking Resume"
-			elif st == lt.torrent_status.error:
+			txt = _STATE_MAP.get(st)
+			if txt:
+				return txt
+			if st == getattr(lt.torrent_status, "error", None):
 				try:
 					if getattr(status, "errc", None):
 						return f"Error: {status.errc.message()}"
@@ -2359,17 +3110,18 @@ Tkinter: {tk.TkVersion}
 	def on_closing(self):
 		if messagebox.askokcancel("Quit", "Quit the client? Active downloads will pause."):
 			self.running = False
-			save_session_state_safe(self.session)
+			save_session_state_safe(self.session, executor=self._io_pool)
 			self.save_config()
 			try:
 				for h in self.session.get_torrents():
 					if h.is_valid():
 						h.pause()
-				if lt_has(self.session, 'pause'):
+				if 'pause' in self._session_caps:
 					self.session.pause()
 				time.sleep(0.5)
 			except Exception:
 				pass
+			self._io_pool.shutdown(wait=True)
 			self.session = None
 			self.root.destroy()
 
@@ -2399,19 +3151,20 @@ Tkinter: {tk.TkVersion}
 		FilePriorityDialog(self.root, handle)
 
 	def expand_all_files(self):
-		for item in self.files_tree.get_children():
-			self.files_tree.item(item, open=True)
-			self._expand_children(self.files_tree, item, True)
+		self._expand_children(self.files_tree, '', True)
 
 	def collapse_all_files(self):
-		for item in self.files_tree.get_children():
-			self.files_tree.item(item, open=False)
-			self._expand_children(self.files_tree, item, False)
+		self._expand_children(self.files_tree, '', False)
 
 	def _expand_children(self, tree, item, open_state):
-		for child in tree.get_children(item):
-			tree.item(child, open=open_state)
-			self._expand_children(tree, child, open_state)
+		# Explicit stack: deep file trees neither recurse nor hit the recursion limit
+		get_children = tree.get_children
+		set_item = tree.item
+		stack = list(get_children(item))
+		while stack:
+			node = stack.pop()
+			set_item(node, open=open_state)
+			stack.extend(get_children(node))
 
 	@staticmethod
 	def get_priority_text(priority: int) -> str:
@@ -2427,19 +3180,6 @@ Tkinter: {tk.TkVersion}
 		}
 		return mapping.get(int(priority), str(priority))
 
-	def calculate_eta(self, status) -> str:
-		try:
-			total_wanted = float(getattr(status, 'total_wanted', 0))
-			total_done = float(getattr(status, 'total_done', 0))
-			remaining = max(0.0, total_wanted - total_done)
-			rate = float(getattr(status, 'download_rate', 0))
-			if rate <= 0.0 or remaining <= 0.0:
-				return "∞"
-			seconds = int(remaining / rate)
-			return self.format_time(seconds)
-		except Exception:
-			return "∞"
-
 	def log(self, msg: str):
 		try:
 			ts = datetime.now().strftime("%H:%M:%S")
@@ -2576,26 +3316,12 @@ class PreFileSelectDialog:
 		scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
 		files = self.ti.files()
-		tree_items = {}
-		def insert_recursive(path_parts, parent_id, file_index=-1):
-			if not path_parts:
-				return
-			part = path_parts[0]
-			current_id = f"{parent_id}/{part}" if parent_id else part
-			if current_id not in tree_items:
-				if len(path_parts) == 1 and file_index != -1:
-					size = files.file_size(file_index)
-					item_id = self.tree.insert(parent_id, tk.END, text=part, values=(TorrentClient.format_bytes(self=None, bytes_value=size),), tags=(str(file_index), 'file'))
-					tree_items[current_id] = item_id
-				else:
-					item_id = self.tree.insert(parent_id, tk.END, text=part, open=True, values=("",))
-					tree_items[current_id] = item_id
-			if len(path_parts) > 1:
-				insert_recursive(path_parts[1:], tree_items[current_id], file_index)
-
-		for i in range(self.ti.num_files()):
-			file_path = str(Path(files.file_path(i)))
-			insert_recursive(file_path.split(os.sep), '', i)
+		insert_file_rows(
+			self.tree,
+			((i, file_path_parts(files.file_path(i))) for i in range(self.ti.num_files())),
+			("",),
+			lambda i: (format_bytes_any(files.file_size(i)),)
+		)
 
 		btns = ttk.Frame(main)
 		btns.pack(fill=tk.X, pady=(10, 0))
@@ -2608,32 +3334,39 @@ class PreFileSelectDialog:
 		self.dialog.wait_window()
 
 	def select_all(self):
-		self.tree.selection_set(self.tree.get_children())
-		for item in self.tree.get_children():
-			self._select_all_children(item)
-
-	def _select_all_children(self, item):
-		for c in self.tree.get_children(item):
-			self.tree.selection_add(c)
-			self._select_all_children(c)
+		# Gather every node first so the selection is set with a single Tcl call
+		get_children = self.tree.get_children
+		nodes = []
+		stack = list(get_children())
+		while stack:
+			node = stack.pop()
+			nodes.append(node)
+			stack.extend(get_children(node))
+		self.tree.selection_set(nodes)
 
 	def select_none(self):
 		self.tree.selection_remove(self.tree.selection())
 
 	def ok(self):
 		selection = set()
+		item_tags = self.tree.item
+		get_children = self.tree.get_children
+		# Read the selection once, not once per node visited
+		selected = set(self.tree.selection())
 		def collect_files(item):
-			tags = self.tree.item(item, 'tags')
-			if 'file' in tags:
-				selection.add(int(tags[0]))
-			for c in self.tree.get_children(item):
-				collect_files(c)
-		for root in self.tree.get_children():
-			if root in self.tree.selection():
+			stack = [item]
+			while stack:
+				node = stack.pop()
+				tags = item_tags(node, 'tags')
+				if 'file' in tags:
+					selection.add(int(tags[0]))
+				stack.extend(get_children(node))
+		for root in get_children():
+			if root in selected:
 				collect_files(root)
 			else:
-				for c in self.tree.get_children(root):
-					if c in self.tree.selection():
+				for c in get_children(root):
+					if c in selected:
 						collect_files(c)
 		if not selection:
 			if not messagebox.askyesno("No Files Selected", "No files selected. Start with all files?", parent=self.dialog):
@@ -2675,7 +3408,7 @@ class QuickPickDialog:
 		for i in range(self.ti.num_files()):
 			name = str(Path(files.file_path(i)).name)
 			size = files.file_size(i)
-			self.listbox.insert(tk.END, f"{name}  ({TorrentClient.format_bytes(self=None, bytes_value=size)})")
+			self.listbox.insert(tk.END, f"{name}  ({format_bytes_any(size)})")
 			self.index_map.append(i)
 
 		btns = ttk.Frame(main)
@@ -2909,8 +3642,8 @@ class MultiMagnetDialog:
 
 	def add_all(self):
 		raw = self.text.get(1.0, tk.END).strip()
-		lines = [ln.strip() for ln in raw.splitlines() if ln.strip()]
-		magnets = [ln for ln in lines if ln.startswith("magnet:")]
+		# One pass over the pasted text; blank lines fail the prefix test anyway
+		magnets = [ln for ln in (l.strip() for l in raw.splitlines()) if ln.startswith("magnet:")]
 		if not magnets:
 			messagebox.showerror("Invalid Input", "Paste at least one magnet URI.", parent=self.dialog)
 			return
@@ -3125,42 +3858,66 @@ class SettingsDialog:
 		ttk.Entry(parent, textvariable=self.global_ul_limit_var).pack(anchor=tk.W, fill=tk.X, pady=(0, 10))
 
 	def apply(self):
+		# Each var is read once; a bad field is reported by name instead of a generic error
+		# Scaling and int() happen inside the guard so inf/nan/1e400 are reported by field too
+		def parse(var, label, conv=int, default=None, scale=None):
+			raw = var.get().strip()
+			if not raw and default is not None:
+				return default
+			try:
+				v = conv(raw)
+				if scale is not None:
+					v = int(v * scale)
+				elif conv is float and v != v:
+					raise ValueError
+				return v
+			except (ValueError, OverflowError):
+				raise ValueError(label)
+
+		try:
+			dl_limit_val = parse(self.global_dl_limit_var, "Global Download Limit", float, scale=1024)
+			ul_limit_val = parse(self.global_ul_limit_var, "Global Upload Limit", float, scale=1024)
+			port_start = parse(self.port_start_var, "Listen Port Range start")
+			port_end = parse(self.port_end_var, "Listen Port Range end")
+			alpha = parse(self.alpha_var, "Window Transparency", float)
+			max_connections = parse(self.max_connections_var, "Maximum Connections")
+			max_uploads = parse(self.max_uploads_var, "Maximum Uploads")
+			fd_conn = parse(self.fd_conn_var, "Fast Download Connections", float, 20, scale=1)
+		except ValueError as e:
+			messagebox.showerror("Invalid Input", f"{e} must be a number.", parent=self.dialog)
+			return
+		if not (1 <= port_start <= 65535 and 1 <= port_end <= 65535 and port_start <= port_end):
+			messagebox.showerror("Invalid Input", "Port range must be 1..65535 and start <= end.", parent=self.dialog)
+			return
+		if not (0.5 <= alpha <= 1.0):
+			messagebox.showerror("Invalid Input", "Transparency must be between 0.5 and 1.0", parent=self.dialog)
+			return
+		new_config = {
+			'download_path': self.download_path_var.get(),
+			'completed_path': self.completed_path_var.get(),
+			'max_connections': max_connections,
+			'max_uploads': max_uploads,
+			'port_range': [port_start, port_end],
+			'enable_dht': True,
+			'enable_lsd': True,
+			'enable_upnp': True,
+			'enable_natpmp': True,
+			'global_dl_limit': max(0, dl_limit_val),
+			'global_ul_limit': max(0, ul_limit_val),
+			'fast_download_default_enabled': bool(self.fd_enabled_var.get()),
+			'fast_download_default_connections': max(1, min(400, fd_conn)),
+			'fast_download_sequential': bool(self.fd_seq_var.get()),
+			'theme': str(self.theme_var.get()).strip(),
+			'background_image_path': self.config.get('background_image_path', None),
+			'window_transparency': alpha,
+			'preselect_always': bool(self.preselect_always_var.get())
+		}
 		try:
-			dl_limit_val = int(float(self.global_dl_limit_var.get()) * 1024)
-			ul_limit_val = int(float(self.global_ul_limit_var.get()) * 1024)
-			port_start = int(self.port_start_var.get())
-			port_end = int(self.port_end_var.get())
-			alpha = float(self.alpha_var.get())
-			if not (1 <= port_start <= 65535 and 1 <= port_end <= 65535 and port_start <= port_end):
-				messagebox.showerror("Invalid Input", "Port range must be 1..65535 and start <= end.", parent=self.dialog)
-				return
-			if not (0.5 <= alpha <= 1.0):
-				messagebox.showerror("Invalid Input", "Transparency must be between 0.5 and 1.0", parent=self.dialog)
-				return
-			new_config = {
-				'download_path': self.download_path_var.get(),
-				'completed_path': self.completed_path_var.get(),
-				'max_connections': int(self.max_connections_var.get()),
-				'max_uploads': int(self.max_uploads_var.get()),
-				'port_range': [port_start, port_end],
-				'enable_dht': True,
-				'enable_lsd': True,
-				'enable_upnp': True,
-				'enable_natpmp': True,
-				'global_dl_limit': max(0, dl_limit_val),
-				'global_ul_limit': max(0, ul_limit_val),
-				'fast_download_default_enabled': bool(self.fd_enabled_var.get()),
-				'fast_download_default_connections': max(1, min(400, int(float(self.fd_conn_var.get()) if self.fd_conn_var.get() else 20))),
-				'fast_download_sequential': bool(self.fd_seq_var.get()),
-				'theme': str(self.theme_var.get()).strip(),
-				'background_image_path': self.config.get('background_image_path', None),
-				'window_transparency': alpha,
-				'preselect_always': bool(self.preselect_always_var.get())
-			}
 			self.apply_callback(new_config)
-			self.dialog.destroy()
-		except Exception:
-			messagebox.showerror("Invalid Input", "Please enter valid numeric values.", parent=self.dialog)
+		except Exception as e:
+			messagebox.showerror("Error", f"Failed to apply settings: {e}", parent=self.dialog)
+			return
+		self.dialog.destroy()
 
 	def browse_download_path(self):
 		path = filedialog.askdirectory(initialdir=self.download_path_var.get(), parent=self.dialog)
@@ -3212,28 +3969,21 @@ class FilePriorityDialog:
 		if getattr(self.handle.status(), "has_metadata", False):
 			ti = self.handle.get_torrent_info()
 			files = ti.files()
-			tree_items = {}
-
-			def insert_recursive(path_parts, parent_id, file_index=-1):
-				if not path_parts:
-					return
-				part = path_parts[0]
-				current_id = f"{parent_id}/{part}" if parent_id else part
-				if current_id not in tree_items:
-					if len(path_parts) == 1 and file_index != -1:
-						size = files.file_size(file_index)
-						priority = self.safe_get_file_priority(self.handle, file_index)
-						item_id = self.tree.insert(parent_id, tk.END, text=part, values=(self.format_bytes(size), self.get_priority_text(priority)), tags=(str(file_index), 'file'))
-						tree_items[current_id] = item_id
-					else:
-						item_id = self.tree.insert(parent_id, tk.END, text=part, open=True, values=("", ""))
-						tree_items[current_id] = item_id
-				if len(path_parts) > 1:
-					insert_recursive(path_parts[1:], tree_items[current_id], file_index)
-
-			for i in range(ti.num_files()):
-				file_path = str(Path(files.file_path(i)))
-				insert_recursive(file_path.split(os.sep), '', i)
+			# One binding call for every priority instead of one per file
+			try:
+				priorities = list(self.handle.get_file_priorities())
+			except Exception:
+				priorities = []
+			n_prio = len(priorities)
+			insert_file_rows(
+				self.tree,
+				((i, file_path_parts(files.file_path(i))) for i in range(ti.num_files())),
+				("", ""),
+				lambda i: (
+					self.format_bytes(files.file_size(i)),
+					self.get_priority_text(int(priorities[i]) if i < n_prio else self.safe_get_file_priority(self.handle, i))
+				)
+			)
 		else:
 			ttk.Label(tree_frame, text="Torrent metadata not available.").pack(pady=20)
 
@@ -3261,7 +4011,7 @@ class FilePriorityDialog:
 	def format_bytes(self, b):
 		if not b:
 			return "0 B"
-		return TorrentClient.format_bytes(self=None, bytes_value=b)
+		return format_bytes_any(b)
 
 	def get_priority_text(self, pr):
 		return TorrentClient.get_priority_text(self=None, priority=pr)
@@ -3272,14 +4022,17 @@ class FilePriorityDialog:
 			messagebox.showinfo("Info", "Select one or more files.", parent=self.dialog)
 			return
 		pr = int(self.priority_var.get())
+		pr_text = self.get_priority_text(pr)
+		item_tags = self.tree.item
+		set_cell = self.tree.set
 		applied = 0
 		for item in selection:
-			tags = self.tree.item(item, 'tags')
+			tags = item_tags(item, 'tags')
 			if 'file' in tags:
 				idx = int(tags[0])
 				try:
 					self.handle.file_priority(idx, pr)
-					self.tree.set(item, 'Priority', self.get_priority_text(pr))
+					set_cell(item, 'Priority', pr_text)
 					applied += 1
 				except Exception:
 					continue
@@ -3289,8 +4042,26 @@ class FilePriorityDialog:
 		self.dialog.destroy()
 
 class PerformanceGraphDialog:
+	# (performance_stats key, colour, label, label y offset, scaled as CPU %)
+	GRAPH_SERIES = (
+		('download_speeds', "blue", "DL (B/s)", 0, False),
+		('upload_speeds', "green", "UL (B/s)", 20, False),
+		('memory_usage', "red", "RSS (B)", 40, False),
+		('cpu_usage', "purple", "CPU %", 60, True),
+	)
+
 	def __init__(self, parent, performance_stats):
 		self.performance_stats = performance_stats
+		self._axis_size = None
+		self._series_items = None
+		self._series_visible = None
+		self._geom = None
+		self._legend_origin = None
+		self._canvas_size = None
+		self._xs_cache = None
+		self._points_bufs = None
+		self._drawn_sig = None
+		self._summary_sig = None
 		self.dialog = tk.Toplevel(parent)
 		self.dialog.title("Performance Graph")
 		self.dialog.geometry("920x660")
@@ -3316,126 +4087,187 @@ class PerformanceGraphDialog:
 		btns.pack(fill=tk.X)
 		ttk.Button(btns, text="Close", command=self.dialog.destroy).pack(side=tk.RIGHT)
 
+		self._resize_pending = False
+		# Pending after() ids by job; cancelled on destroy so no callback outlives the dialog
+		self._after_ids = {}
 		self.canvas.bind('<Configure>', self.on_canvas_resize)
-		self.dialog.after(100, self.draw_placeholder_graph)
-		self.dialog.after(100, self.update_summary_label)
-
-	def on_canvas_resize(self, event):
-		self.draw_placeholder_graph()
+		self.dialog.bind('<Destroy>', self._cancel_timers)
+		self._after_ids['graph'] = self.dialog.after(100, self.graph_tick)
+		self._after_ids['summary'] = self.dialog.after(100, self.update_summary_label)
 
-	def draw_placeholder_graph(self):
-		self.canvas.delete("all")
-		width = self.canvas.winfo_width()
-		height = self.canvas.winfo_height()
-		if width <= 100 or height <= 100:
+	def _cancel_timers(self, event):
+		# Toplevel bindings also fire for every child being destroyed
+		if event.widget is not self.dialog:
 			return
+		for after_id in self._after_ids.values():
+			try:
+				self.dialog.after_cancel(after_id)
+			except Exception:
+				pass
+		self._after_ids.clear()
 
-		padding = 40
-		x_axis_start = padding
-		x_axis_end = width - padding
-		y_axis_start = height - padding
-		y_axis_end = padding
+	def on_canvas_resize(self, event):
+		self._canvas_size = (event.width, event.height)
+		# A window drag fires Configure in bursts; redraw once it settles
+		if self._resize_pending:
+			return
+		self._resize_pending = True
+		self._after_ids['resize'] = self.dialog.after(30, self._redraw_after_resize)
 
-		self.canvas.create_line(x_axis_start, y_axis_start, x_axis_end, y_axis_start, fill="gray", arrow=tk.LAST, width=1)
-		self.canvas.create_line(x_axis_start, y_axis_start, y_axis_start, y_axis_end, fill="gray", width=1)
+	def _redraw_after_resize(self):
+		self._resize_pending = False
+		self.draw_placeholder_graph()
 
-		self.canvas.create_text(width / 2, height - padding / 2, text="Time (most recent on right)", fill="gray")
-		self.canvas.create_text(padding / 2, height / 2, text="Value", fill="gray", angle=90)
-		self.canvas.create_text(width / 2, padding / 2, text="Performance Over Time", font=('Arial', 12, 'bold'))
+	def graph_tick(self):
+		# The only periodic redraw; resize redraws must not start another 3 s chain
+		self.draw_placeholder_graph()
+		self._after_ids['graph'] = self.dialog.after(3000, self.graph_tick)
 
-		dl_speeds = list(self.performance_stats['download_speeds'])
-		ul_speeds = list(self.performance_stats['upload_speeds'])
-		mem_usage = list(self.performance_stats['memory_usage'])
-		cpu_usage = list(self.performance_stats['cpu_usage'])
+	def _recompute_axes(self, width, height):
+		# Geometry, axes, titles and legend positions only change with the canvas size
+		canvas = self.canvas
+		padding = 40
+		self._axis_size = (width, height)
+		self._geom = (padding, width - padding, height - padding, padding)
+		x_axis_start, x_axis_end, y_axis_start, y_axis_end = self._geom
+		canvas.delete("axis")
+		canvas.create_line(x_axis_start, y_axis_start, x_axis_end, y_axis_start, fill="gray", arrow=tk.LAST, width=1, tags="axis")
+		canvas.create_line(x_axis_start, y_axis_start, x_axis_start, y_axis_end, fill="gray", width=1, tags="axis")
+		canvas.create_text(width / 2, height - padding / 2, text="Time (most recent on right)", fill="gray", tags="axis")
+		canvas.create_text(padding / 2, height / 2, text="Value", fill="gray", angle=90, tags="axis")
+		canvas.create_text(width / 2, padding / 2, text="Performance Over Time", font=('Arial', 12, 'bold'), tags="axis")
+		# The legend shares one tag: after the first placement a resize shifts it with one move()
+		origin = (x_axis_end + 5, y_axis_end)
+		if self._legend_origin is None:
+			for (_, text_id), (_, _, _, label_offset, _) in zip(self._series_items, self.GRAPH_SERIES):
+				canvas.coords(text_id, origin[0], origin[1] + label_offset)
+		elif origin != self._legend_origin:
+			canvas.move("legend", origin[0] - self._legend_origin[0], origin[1] - self._legend_origin[1])
+		self._legend_origin = origin
+
+	def _show_series(self, i, visible):
+		# Only touch Tk when a series actually appears or disappears
+		if self._series_visible[i] == visible:
+			return
+		self._series_visible[i] = visible
+		state = tk.NORMAL if visible else tk.HIDDEN
+		for item_id in self._series_items[i]:
+			self.canvas.itemconfigure(item_id, state=state)
 
-		if not dl_speeds and not ul_speeds and not mem_usage and not cpu_usage:
-			self.canvas.create_text(width / 2, height / 2, text="No performance data available yet.", fill="black")
+	def draw_placeholder_graph(self):
+		canvas = self.canvas
+		# Size comes from the last <Configure>; query Tk only before the first one
+		width, height = self._canvas_size or (canvas.winfo_width(), canvas.winfo_height())
+		if width <= 100 or height <= 100:
+			return
+		# StatsRing.version only moves when a window changes: same size and versions means the same picture
+		stats = self.performance_stats
+		sig = (width, height) + tuple(stats[key].version for key, _, _, _, _ in self.GRAPH_SERIES)
+		if sig == self._drawn_sig:
+			return
+		self._drawn_sig = sig
+
+		# Series lines and legend labels are created once and then only moved with coords()
+		if self._series_items is None:
+			self._series_items = [
+				(
+					canvas.create_line(0, 0, 0, 0, fill=color, smooth=True, width=2, state=tk.HIDDEN),
+					canvas.create_text(0, 0, text=label, fill=color, anchor=tk.W, state=tk.HIDDEN, tags="legend"),
+				)
+				for _, color, label, _, _ in self.GRAPH_SERIES
+			]
+			self._series_visible = [False] * len(self.GRAPH_SERIES)
+		if self._axis_size != (width, height):
+			self._recompute_axes(width, height)
+		x_axis_start, x_axis_end, y_axis_start, y_axis_end = self._geom
+		canvas.delete("empty")
+
+		series = [stats[key].snapshot() for key, _, _, _, _ in self.GRAPH_SERIES]
+		data_len = max(len(data) for data in series)
+		if data_len == 0:
+			for i in range(len(series)):
+				self._show_series(i, False)
+			canvas.create_text(width / 2, height / 2, text="No performance data available yet.", fill="black", tags="empty")
 			return
 
-		max_speed = max(max(dl_speeds) if dl_speeds else 0, max(ul_speeds) if ul_speeds else 0)
-		max_mem = max(mem_usage) if mem_usage else 0
-		max_cpu = max(cpu_usage) if cpu_usage else 0
+		max_speed = max(stats['download_speeds'].peak(), stats['upload_speeds'].peak())
+		max_mem = stats['memory_usage'].peak()
+		max_cpu = stats['cpu_usage'].peak()
 
 		scale_factor_cpu = 1024 * 1024
 		max_y = max(max_speed, max_mem, max_cpu * scale_factor_cpu)
 		max_y = max_y if max_y > 0 else 1
 
-		data_len = max(len(dl_speeds), len(ul_speeds), len(mem_usage), len(cpu_usage))
-		if data_len == 0:
-			self.canvas.create_text(width / 2, height / 2, text="No performance data available yet.", fill="black")
-			return
-
 		x_interval = (x_axis_end - x_axis_start) / max(data_len - 1, 1)
 		y_scale = (y_axis_start - y_axis_end) / max_y
-
-		def plot_line(data, color, label_text, label_offset):
-			if not data:
-				return
-			points = []
-			for i, raw in enumerate(data):
-				x = x_axis_start + i * x_interval
-				y_raw = raw * (scale_factor_cpu if label_text == "CPU %" else 1)
-				y = y_axis_start - (y_raw * y_scale)
-				points.extend([x, y])
+		# Never hand Tk more vertices than the plot has pixel columns: smoothing
+		# runs on the Tk thread and its cost grows with the vertex count
+		step = max(1, -(-data_len // max(int(x_axis_end - x_axis_start), 1)))
+		# x positions depend only on sample count and the axis span; once the rings
+		# fill up the key is constant and every tick reuses the same list
+		xs_key = (data_len, x_axis_start, x_axis_end, step)
+		if self._xs_cache is None or self._xs_cache[0] != xs_key:
+			xs = [x_axis_start + i * x_interval for i in range(0, data_len, step)]
+			self._xs_cache = (xs_key, xs)
+			# One flat x,y buffer per series with the x slots filled in; ticks only rewrite y
+			self._points_bufs = []
+			for _ in self.GRAPH_SERIES:
+				buf = [0.0] * (2 * len(xs))
+				buf[0::2] = xs
+				self._points_bufs.append(buf)
+		xs = self._xs_cache[1]
+
+		for i, (data, (line_id, _), (_, _, _, _, is_cpu)) in enumerate(zip(series, self._series_items, self.GRAPH_SERIES)):
+			# Per-series factor folded into one multiplier; points are built flat for a single coords()
+			k = (scale_factor_cpu if is_cpu else 1) * y_scale
+			if step > 1:
+				# Keep each bucket's peak so short spikes stay visible
+				data = [max(data[j:j + step]) for j in range(0, len(data), step)]
+			ys = [y_axis_start - raw * k for raw in data]
+			if len(ys) == len(xs):
+				points = self._points_bufs[i]
+				points[1::2] = ys
+			else:
+				points = [c for x, y in zip(xs, ys) for c in (x, y)]
 			if len(points) > 2:
-				self.canvas.create_line(points, fill=color, smooth=True, width=2)
-				self.canvas.create_text(x_axis_end + 5, y_axis_end + label_offset, text=label_text, fill=color, anchor=tk.W)
-
-		plot_line(dl_speeds, "blue", "DL (B/s)", 0)
-		plot_line(ul_speeds, "green", "UL (B/s)", 20)
-		plot_line(mem_usage, "red", "RSS (B)", 40)
-		plot_line(cpu_usage, "purple", "CPU %", 60)
-
-		if self.dialog.winfo_exists():
-			self.dialog.after(3000, self.draw_placeholder_graph)
+				canvas.coords(line_id, points)
+				self._show_series(i, True)
+			else:
+				self._show_series(i, False)
 
 	def update_summary_label(self):
-		if not self.dialog.winfo_exists():
+		# Means come from each ring's running sum; no copy or re-sum per tick
+		dl_speeds = self.performance_stats['download_speeds']
+		ul_speeds = self.performance_stats['upload_speeds']
+		mem_usage = self.performance_stats['memory_usage']
+		cpu_usage = self.performance_stats['cpu_usage']
+		self._after_ids['summary'] = self.dialog.after(1000, self.update_summary_label)
+		sig = (dl_speeds.version, ul_speeds.version, mem_usage.version, cpu_usage.version)
+		if sig == self._summary_sig:
 			return
-
-		def avg(arr):
-			return sum(arr) / len(arr) if arr else 0.0
-
-		dl_speeds = list(self.performance_stats['download_speeds'])
-		ul_speeds = list(self.performance_stats['upload_speeds'])
-		mem_usage = list(self.performance_stats['memory_usage'])
-		cpu_usage = list(self.performance_stats['cpu_usage'])
+		self._summary_sig = sig
 
 		text = "Current Performance Summary:\n"
 		if dl_speeds:
-			text += f"Avg DL (last {len(dl_speeds)}s): {self.format_speed(avg(dl_speeds))}\n"
+			text += f"Avg DL (last {len(dl_speeds)}s): {self.format_speed(dl_speeds.mean())}\n"
 		if ul_speeds:
-			text += f"Avg UL (last {len(ul_speeds)}s): {self.format_speed(avg(ul_speeds))}\n"
+			text += f"Avg UL (last {len(ul_speeds)}s): {self.format_speed(ul_speeds.mean())}\n"
 		if mem_usage:
-			text += f"Avg RSS (last {len(mem_usage)}s): {self.format_bytes(avg(mem_usage))}\n"
+			text += f"Avg RSS (last {len(mem_usage)}s): {self.format_bytes(mem_usage.mean())}\n"
 		if cpu_usage:
-			text += f"Avg CPU (last {len(cpu_usage)}s): {avg(cpu_usage):.1f}%\n"
+			text += f"Avg CPU (last {len(cpu_usage)}s): {cpu_usage.mean():.1f}%\n"
 
 		self.summary_label.config(text=text)
-		if self.dialog.winfo_exists():
-			self.dialog.after(1000, self.update_summary_label)
 
 	def format_speed(self, bps):
 		if not bps:
 			return "0 B/s"
-		units = ['B/s', 'KB/s', 'MB/s', 'GB/s', 'TB/s']
-		i = 0
-		v = float(bps)
-		while v >= 1024.0 and i < len(units) - 1:
-			v /= 1024.0
-			i += 1
-		return f"{v:.1f} {units[i]}"
+		return f"{_format_bytes_value(float(bps))}/s"
 
 	def format_bytes(self, b):
 		if not b:
 			return "0 B"
-		units = ['B', 'KB', 'MB', 'GB', 'TB', 'PB']
-		i = 0
-		v = float(b)
-		while v >= 1024.0 and i < len(units) - 1:
-			v /= 1024.0
-			i += 1
-		return f"{v:.1f} {units[i]}"
+		return _format_bytes_value(float(b))
 
 class DownloadHistoryDialog:
 	def __init__(self, parent, download_history):
@@ -3467,22 +4299,36 @@ class DownloadHistoryDialog:
 		self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 		scroll.pack(side=tk.RIGHT, fill=tk.Y)
 
-		for item in reversed(self.download_history):
-			self.tree.insert('', tk.END, values=(
+		# Format every row first, then hand them to Tk in one tight insert loop
+		rows = [self.display_row(item) for item in reversed(self.download_history)]
+		insert = self.tree.insert
+		for values in rows:
+			insert('', tk.END, values=values)
+
+		btns = ttk.Frame(self.dialog, padding="0 10 10 10")
+		btns.pack(fill=tk.X)
+		ttk.Button(btns, text="Close", command=self.dialog.destroy).pack(side=tk.RIGHT)
+
+	@staticmethod
+	def display_row(item):
+		# History records never change once added: format them once and keep the
+		# strings on the record so later opens skip strftime and the hash slice
+		row = item.get('_display_row')
+		if row is None:
+			row = item['_display_row'] = (
 				item.get('name', 'Unknown'),
 				(item.get('hash', '')[:10] + "...") if item.get('hash') else "",
 				item.get('added_time').strftime("%Y-%m-%d %H:%M") if item.get('added_time') else "",
 				item.get('source', 'N/A'),
 				item.get('save_path', 'N/A')
-			))
-
-		btns = ttk.Frame(self.dialog, padding="0 10 10 10")
-		btns.pack(fill=tk.X)
-		ttk.Button(btns, text="Close", command=self.dialog.destroy).pack(side=tk.RIGHT)
+			)
+		return row
 
 class SpeedLimitsDialog:
 	def __init__(self, parent, session):
 		self.session = session
+		# Binding capabilities are fixed for the session; probe them once like TorrentClient does
+		self._caps = lt_caps(session)
 		self.dialog = tk.Toplevel(parent)
 		self.dialog.title("Global Speed Limits")
 		self.dialog.transient(parent)
@@ -3497,11 +4343,11 @@ class SpeedLimitsDialog:
 		main.pack(fill=tk.BOTH, expand=True)
 
 		try:
-			cur_dl = self.session.download_rate_limit() // 1024 if lt_has(self.session, 'download_rate_limit') else 0
+			cur_dl = self.session.download_rate_limit() // 1024 if 'download_rate_limit' in self._caps else 0
 		except Exception:
 			cur_dl = 0
 		try:
-			cur_ul = self.session.upload_rate_limit() // 1024 if lt_has(self.session, 'upload_rate_limit') else 0
+			cur_ul = self.session.upload_rate_limit() // 1024 if 'upload_rate_limit' in self._caps else 0
 		except Exception:
 			cur_ul = 0
 
@@ -3518,20 +4364,30 @@ class SpeedLimitsDialog:
 		ttk.Button(btns, text="Cancel", command=self.cancel).pack(side=tk.RIGHT)
 		ttk.Button(btns, text="Apply", command=self.apply).pack(side=tk.RIGHT, padx=(0, 5))
 
+	@staticmethod
+	def _kbps_to_bps(text):
+		return int(float(text) * 1024)
+
 	def apply(self):
+		# Only parsing is guarded here; session errors are reported as what they are
 		try:
-			dl_limit = int(float(self.dl_limit_var.get()) * 1024)
-			ul_limit = int(float(self.ul_limit_var.get()) * 1024)
-			if dl_limit < 0 or ul_limit < 0:
-				messagebox.showerror("Error", "Limits cannot be negative.", parent=self.dialog)
-				return
-			if lt_has(self.session, 'set_download_rate_limit'):
-				self.session.set_download_rate_limit(max(0, dl_limit))
-			if lt_has(self.session, 'set_upload_rate_limit'):
-				self.session.set_upload_rate_limit(max(0, ul_limit))
-			self.dialog.destroy()
-		except Exception:
+			dl_limit = self._kbps_to_bps(self.dl_limit_var.get())
+			ul_limit = self._kbps_to_bps(self.ul_limit_var.get())
+		except (ValueError, OverflowError):
 			messagebox.showerror("Error", "Please enter valid numeric values.", parent=self.dialog)
+			return
+		if dl_limit < 0 or ul_limit < 0:
+			messagebox.showerror("Error", "Limits cannot be negative.", parent=self.dialog)
+			return
+		try:
+			if 'set_download_rate_limit' in self._caps:
+				self.session.set_download_rate_limit(dl_limit)
+			if 'set_upload_rate_limit' in self._caps:
+				self.session.set_upload_rate_limit(ul_limit)
+		except Exception as e:
+			messagebox.showerror("Error", f"Failed to apply limits: {e}", parent=self.dialog)
+			return
+		self.dialog.destroy()
 
 	def cancel(self):
 		self.dialog.destroy()